@@ -5,10 +5,13 @@ This example shows how to handle multiple sensors on the same bus.
 """
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 from src.core.constants import CommType
+from src.core.mqtt import MqttClient
 from src.plugins.air import AirSensor
+from src.utils.timing import run_periodic
 
 # Configure logging
 logging.basicConfig(
@@ -27,9 +30,37 @@ MQTT_CONFIG = {
     "topic_up": "garden_weather/up"      # Data FROM sensors
 }
 
+# Shared MQTT clients keyed by broker identity. All sensors on the same
+# bus talk through one connection instead of opening one session each.
+_mqtt_pool: Dict[tuple, MqttClient] = {}
+
+def get_shared_mqtt_client(mqtt_config: Dict) -> MqttClient:
+    """Get (or create) the shared MQTT client for a broker.
+
+    Args:
+        mqtt_config: MQTT configuration with host/port/username/password
+
+    Returns:
+        Shared MqttClient instance for that broker
+    """
+    key = (
+        mqtt_config["host"],
+        mqtt_config["port"],
+        mqtt_config.get("username")
+    )
+    if key not in _mqtt_pool:
+        _mqtt_pool[key] = MqttClient(
+            client_id="air_sensor_monitor",
+            host=mqtt_config["host"],
+            port=mqtt_config["port"],
+            username=mqtt_config.get("username"),
+            password=mqtt_config.get("password")
+        )
+    return _mqtt_pool[key]
+
 class AirSensorMonitor:
     """Monitor multiple air sensors."""
-    
+
     def __init__(
         self,
         mqtt_config: Dict,
@@ -43,6 +74,10 @@ class AirSensorMonitor:
             unit_ids: List of sensor unit IDs to monitor
             read_interval: Data reading interval in seconds
         """
+        # All sensors share one MQTT connection; responses are routed
+        # back to the right sensor by the unit-id byte of the frame
+        self.mqtt_client = get_shared_mqtt_client(mqtt_config)
+
         # Create sensors for each unit ID
         self.sensors = {}
         for unit_id in unit_ids:
@@ -52,19 +87,27 @@ class AirSensorMonitor:
                 client_id=f"air_sensor_{unit_id}",
                 request_topic=mqtt_config["topic_down"],
                 response_topic=mqtt_config["topic_up"],
-                host=mqtt_config["host"],
-                port=mqtt_config["port"],
-                username=mqtt_config["username"],
-                password=mqtt_config["password"]
+                mqtt_client=self.mqtt_client
             )
             self.sensors[unit_id] = sensor
-            
+
+        # Poll all sensors concurrently; responses are demultiplexed by
+        # unit ID, so total latency is ~one round trip instead of N
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(len(self.sensors), 1),
+            thread_name_prefix="air-read"
+        )
+
         self.read_interval = read_interval
         
     def start(self):
         """Start monitoring."""
         try:
-            # Connect all sensors
+            # Bring up the shared connection (and its single network
+            # loop thread) once; the per-sensor connect() calls below
+            # only register their response subscriptions on it
+            self.mqtt_client.connect()
+
             for unit_id, sensor in self.sensors.items():
                 sensor.modbus.connect()
                 logger.info(f"Connected sensor {unit_id}")
@@ -76,35 +119,34 @@ class AirSensorMonitor:
             )
             
             # Start reading loop
-            last_read = 0
             try:
-                while True:
-                    now = time.time()
-                    if now - last_read >= self.read_interval:
-                        self._read_and_log_data()
-                        last_read = now
-                    time.sleep(1)
-                    
+                run_periodic(self.read_interval, self._read_and_log_data)
+
             except KeyboardInterrupt:
                 logger.info("Stopping monitor")
                 
         finally:
-            # Disconnect all sensors
-            for sensor in self.sensors.values():
-                sensor.modbus.disconnect()
+            # Sensors don't own the shared client; disconnect it once
+            self.mqtt_client.disconnect()
                 
     def _read_and_log_data(self):
         """Read and log data from all sensors."""
-        for unit_id, sensor in self.sensors.items():
+        # Issue every read at once, then collect results
+        futures = {
+            unit_id: self._executor.submit(sensor.get_all)
+            for unit_id, sensor in self.sensors.items()
+        }
+        for unit_id, future in futures.items():
             try:
-                # Read all parameters in one request
-                data = sensor.get_all()
+                data = future.result(timeout=30)
                 logger.info(
-                    f"Sensor {unit_id}: "
-                    f"Temperature={data['temperature']:.1f}°C, "
-                    f"Humidity={data['humidity']:.1f}%, "
-                    f"CO2={data['co2']:.0f}ppm, "
-                    f"Light={data['light']:.0f}lux"
+                    "Sensor %s: Temperature=%.1f°C, Humidity=%.1f%%, "
+                    "CO2=%.0fppm, Light=%.0flux",
+                    unit_id,
+                    data['temperature'],
+                    data['humidity'],
+                    data['co2'],
+                    data['light']
                 )
                 
             except Exception as e:
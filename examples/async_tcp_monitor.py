@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Asyncio variant of the soil and air monitoring system.
+
+A single event loop drives pymodbus's AsyncModbusTcpClient, so the poll
+loop can overlap the HTTP upload of one cycle with the Modbus reads of
+the next without threads or locks around the client.
+"""
+import asyncio
+import logging
+import os
+import json
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Any, Dict, Optional
+from dotenv import load_dotenv
+
+from src.core.constants import AirRegister, SoilRegister
+from src.plugins.soil import SoilSensor, SOIL_SENSOR_CONFIG
+from src.plugins.air import AirSensor, AIR_SENSOR_CONFIG
+from src.core.modbus import ModbusTCPSource
+from pymodbus.client import AsyncModbusTcpClient
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# Prefer orjson for payload serialization; it returns bytes, which
+# requests accepts directly as the request body
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+# TCP Configuration from environment variables
+TCP_CONFIG = {
+    "host": os.environ.get("MODBUS_HOST", "192.168.2.73"),
+    "port": int(os.environ.get("MODBUS_PORT", 502)),
+    "soil_unit_id": int(os.environ.get("SOIL_UNIT_ID", 2)),
+    "air_unit_id": int(os.environ.get("AIR_UNIT_ID", 1))
+}
+
+
+class AsyncSoilAndAirMonitor:
+    """Soil and air monitoring system on a single asyncio event loop."""
+
+    def __init__(
+        self,
+        tcp_config: Dict,
+        read_interval: int = 60,  # Read every 60 seconds
+        api_url: str = None,      # HTTP API URL for sending data
+    ):
+        """Initialize monitor.
+
+        Args:
+            tcp_config: TCP configuration
+            read_interval: Data reading interval in seconds
+            api_url: URL for HTTP API endpoint
+        """
+        self.client = AsyncModbusTcpClient(
+            host=tcp_config["host"],
+            port=tcp_config["port"]
+        )
+
+        # Modbus spec requires one outstanding transaction per slave;
+        # the lock serializes the two sensor reads on the shared socket
+        self._modbus_lock = asyncio.Lock()
+
+        self.soil_unit_id = tcp_config["soil_unit_id"]
+        self.air_unit_id = tcp_config["air_unit_id"]
+
+        # Only the sensors' parsers are used here; all reads go through
+        # the async client, so this source is never connected
+        parse_source = ModbusTCPSource(
+            host=tcp_config["host"],
+            port=tcp_config["port"]
+        )
+        self.soil_sensor = SoilSensor(unit_id=self.soil_unit_id, source=parse_source)
+        self.air_sensor = AirSensor(unit_id=self.air_unit_id, source=parse_source)
+
+        self.read_interval = read_interval
+        self.host = tcp_config["host"]
+        self.port = tcp_config["port"]
+        self.api_url = api_url
+
+        # 温度误差校正，启动时解析一次，避免每个周期读取环境变量
+        self.soil_temp_diff = float(os.environ.get("SOIL_TEMP_DIFF", 0))
+        self.air_temp_diff = float(os.environ.get("AIR_TEMP_DIFF", 0))
+
+        # 复用同一个HTTP会话：连接池保持TCP/TLS连接。requests是本仓库
+        # 的既有依赖，POST在executor线程中执行，不会阻塞事件循环
+        self.http = requests.Session()
+        self.http.trust_env = False
+        self.http.headers.update({
+            'Content-Type': 'application/json',
+            'User-Agent': 'SoilAndAirMonitor/1.0',
+            'Accept': '*/*'
+        })
+        retry = Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504]
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=1,
+            max_retries=retry
+        )
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
+        # Previous cycle's POST task; awaited (drop-if-pending) next cycle
+        self._post_task: Optional[asyncio.Task] = None
+
+    async def run(self):
+        """Run the monitoring loop until cancelled."""
+        await self.client.connect()
+        if not self.client.connected:
+            logger.error("Failed to connect to Modbus TCP server")
+            return
+        logger.info(f"Connected to Modbus TCP server at {self.host}:{self.port}")
+        logger.info(f"Reading interval: {self.read_interval} seconds")
+        if not self.api_url:
+            logger.warning("No API URL provided. Data will not be sent to HTTP endpoint.")
+
+        loop = asyncio.get_running_loop()
+        next_read = loop.time()
+        try:
+            while True:
+                await self._read_and_process_data()
+                next_read += self.read_interval
+                await asyncio.sleep(max(0, next_read - loop.time()))
+        finally:
+            if self._post_task is not None:
+                await asyncio.gather(self._post_task, return_exceptions=True)
+            self.client.close()
+            logger.info("Disconnected from Modbus TCP server")
+
+    async def _read_block(self, unit: int, address: int, count: int):
+        """Read one register block, serialized on the shared client.
+
+        Args:
+            unit: Modbus unit/slave ID
+            address: Starting register address
+            count: Number of registers
+
+        Returns:
+            List of register values
+        """
+        async with self._modbus_lock:
+            response = await asyncio.wait_for(
+                self.client.read_holding_registers(
+                    address=address, count=count, slave=unit
+                ),
+                timeout=10
+            )
+        if response.isError():
+            raise IOError(f"Failed to read register {address} from unit {unit}")
+        return response.registers
+
+    async def _read_and_process_data(self):
+        """Read, process, and upload sensor data."""
+        soil_data = {}
+        air_data = {}
+
+        # 两个读操作作为任务并发提交；锁保证它们在总线上仍然串行，
+        # 但解析/日志与下一个请求的发出可以重叠
+        soil_task = asyncio.create_task(
+            self._read_block(self.soil_unit_id, SoilRegister.MOISTURE, 4)
+        )
+        air_task = asyncio.create_task(
+            self._read_block(self.air_unit_id, AirRegister.HUMIDITY, 5)
+        )
+        soil_regs, air_regs = await asyncio.gather(
+            soil_task, air_task, return_exceptions=True
+        )
+
+        if isinstance(soil_regs, Exception):
+            logger.error(f"Error reading soil sensor data: {soil_regs}")
+        else:
+            soil_data = {
+                k: round(v, 2) if isinstance(v, float) else v
+                for k, v in self.soil_sensor.custom_soil_all(soil_regs).items()
+            }
+            soil_data["temperature"] = round(
+                soil_data["temperature"] + self.soil_temp_diff, 2
+            )
+            logger.info(
+                "Soil Data: Moisture=%s%%, Temperature=%s°C, EC=%sus/cm, pH=%s",
+                soil_data['moisture'], soil_data['temperature'],
+                soil_data['ec'], soil_data['ph']
+            )
+
+        if isinstance(air_regs, Exception):
+            logger.error(f"Error reading air sensor data: {air_regs}")
+        else:
+            air_data = {
+                k: round(v, 2) if isinstance(v, float) else v
+                for k, v in self.air_sensor.custom_air_all(air_regs).items()
+            }
+            air_data["temperature"] = round(
+                air_data["temperature"] + self.air_temp_diff, 2
+            )
+            logger.info(
+                "Air Data: Humidity=%s%%, Temperature=%s°C, CO2=%sppm, Light=%slux",
+                air_data['humidity'], air_data['temperature'],
+                air_data['co2'], air_data['light']
+            )
+
+        if (soil_data or air_data) and self.api_url:
+            combined_data = {f"soil_{k}": v for k, v in soil_data.items()}
+            combined_data.update({f"air_{k}": v for k, v in air_data.items()})
+
+            # 上个周期的POST还没完成时直接丢弃本次数据，保证任何时刻
+            # 最多只有一个在途请求
+            if self._post_task is not None and not self._post_task.done():
+                logger.warning("Previous POST still pending, dropping this reading")
+                return
+            self._post_task = asyncio.create_task(
+                self._post_data(_json_dumps(combined_data))
+            )
+
+    async def _post_data(self, data: bytes):
+        """POST one payload without blocking the event loop.
+
+        Args:
+            data: Serialized JSON payload
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            response = await loop.run_in_executor(
+                None,
+                lambda: self.http.post(url=self.api_url, data=data, timeout=10)
+            )
+            if response.status_code == 200:
+                logger.info("Data sent to HTTP endpoint successfully")
+            else:
+                logger.error(f"Failed to send data to HTTP endpoint. Status code: {response.status_code}")
+        except Exception as e:
+            logger.error(f"Error sending data to HTTP endpoint: {e}")
+
+
+def main():
+    """Run the async soil and air monitoring system."""
+    try:
+        # Load environment variables from .env file
+        load_dotenv()
+
+        api_url = os.environ.get('API_URL', "")
+        read_interval = int(os.environ.get("READ_INTERVAL", 30))
+
+        monitor = AsyncSoilAndAirMonitor(
+            tcp_config=TCP_CONFIG,
+            read_interval=read_interval,
+            api_url=api_url
+        )
+
+        asyncio.run(monitor.run())
+
+    except KeyboardInterrupt:
+        logger.info("Stopping monitoring")
+    except Exception as e:
+        logger.error(f"Monitor error: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -78,7 +78,7 @@ def example_3_analyze_communication():
     print("\nExample 3: Analyze command-response communication")
     
     # Example: Reading all parameters
-    command = SoilSensorTools.READ_ALL
+    command = SoilSensorTools.read_all_frame()
     response = bytes.fromhex("01 03 08 02 92 FF 9B 03 E8 00 38 57 B6")
     
     analysis = SoilSensorTools.analyze_response(command, response)
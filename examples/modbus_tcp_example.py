@@ -15,6 +15,7 @@ sys.path.insert(0, ".")
 from src.core.constants import CommType, ModbusFunction, SoilRegister
 from src.core.modbus import ModbusAdapter
 from src.plugins.soil import SOIL_SENSOR_CONFIG, SoilSensor
+from src.utils.timing import run_periodic
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +31,10 @@ TCP_CONFIG = {
     "unit_id": int(os.environ.get("MODBUS_UNIT_ID", 1))    # Modbus unit/slave ID
 }
 
+# Optional pause between back-to-back reads, in seconds, for devices
+# that can't keep up with consecutive requests. Off by default.
+INTER_READ_DELAY = float(os.environ.get("INTER_READ_DELAY", 0))
+
 class SoilSensorTCP:
     """Class for soil sensor data using Modbus TCP."""
     
@@ -68,15 +73,9 @@ class SoilSensorTCP:
             logger.info(f"Connected to Modbus TCP server at {self.host}:{self.port}")
             
             # Start reading loop
-            last_read = 0
             try:
-                while True:
-                    now = time.time()
-                    if now - last_read >= self.read_interval:
-                        self._read_and_log_data()
-                        last_read = now
-                    time.sleep(1)
-                    
+                run_periodic(self.read_interval, self._read_and_log_data)
+
             except KeyboardInterrupt:
                 logger.info("Stopping sensor reading")
                 
@@ -90,24 +89,25 @@ class SoilSensorTCP:
             basic = self.sensor.read_composite("all")
             
             logger.info(
-                f"Basic parameters: "
-                f"Moisture={basic['moisture']}%, "
-                f"Temperature={basic['temperature']}°C, "
-                f"EC={basic['ec']}us/cm, "
-                f"pH={basic['ph']}"
+                "Basic parameters: Moisture=%s%%, Temperature=%s°C, "
+                "EC=%sus/cm, pH=%s",
+                basic['moisture'],
+                basic['temperature'],
+                basic['ec'],
+                basic['ph']
             )
             
-            # Small delay between reads
-            time.sleep(1)
-            
+            if INTER_READ_DELAY:
+                time.sleep(INTER_READ_DELAY)
+
             # Read NPK values
             npk = self.sensor.read_composite("npk")
                     
             logger.info(
-                f"NPK values: "
-                f"N={npk['nitrogen']}mg/kg, "
-                f"P={npk['phosphorus']}mg/kg, "
-                f"K={npk['potassium']}mg/kg"
+                "NPK values: N=%smg/kg, P=%smg/kg, K=%smg/kg",
+                npk['nitrogen'],
+                npk['phosphorus'],
+                npk['potassium']
             )
             
         except Exception as e:
@@ -3,6 +3,9 @@
 Example of a Modbus-MQTT bridge that forwards raw Modbus data over MQTT.
 """
 import logging
+import queue
+import random
+import threading
 import time
 import json
 import os
@@ -13,6 +16,7 @@ from src.core.constants import (CommType, DEFAULT_MQTT_QOS, ModbusBaudRate,
 from src.core.modbus import ModbusAdapter, ModbusMqttSource
 from src.core.mqtt import MqttClient
 from src.plugins.soil import SOIL_SENSOR_CONFIG, SoilSensor
+from src.utils.timing import run_periodic
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +25,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for the hot telemetry path; it serializes straight to
+# bytes, which paho accepts without a separate encode step
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 # MQTT Configuration from environment variables
 MQTT_CONFIG = {
     "host": os.environ.get("MQTT_HOST", "things.shanhehuhai.cn"),
@@ -31,7 +46,27 @@ MQTT_CONFIG = {
     "topic_up": os.environ.get("MQTT_TOPIC_UP", "garden_weather/up"),      # Data FROM sensor
     "unit_id": int(os.environ.get("MQTT_UNIT_ID", 2)),
     "telemetry_topic": os.environ.get("MQTT_TELEMETRY_TOPIC", "v1/devices/me/telemetry"),
-    "telemetry_client_id": os.environ.get("MQTT_CLIENT_ID", "gardenx")
+    "telemetry_client_id": os.environ.get("MQTT_CLIENT_ID", "gardenx"),
+    # Periodic telemetry survives losing a sample (the next cycle
+    # supersedes it), so default to QoS 0 and skip the PUBACK round trip
+    "telemetry_qos": int(os.environ.get("MQTT_TELEMETRY_QOS", 0))
+}
+
+# Telemetry batching: readings are buffered and published as one JSON
+# array, trading a little latency for fewer PUBLISH/PUBACK round trips
+TELEMETRY_BATCH_SIZE = int(os.environ.get("TELEMETRY_BATCH_SIZE", 8))
+TELEMETRY_BATCH_MS = int(os.environ.get("TELEMETRY_BATCH_MS", 2000))
+
+# Delta suppression: readings that moved less than this since the last
+# publish are considered sensor noise and skipped. A full snapshot is
+# still sent every TELEMETRY_HEARTBEAT_S seconds so the platform never
+# sees the device as stale.
+TELEMETRY_HEARTBEAT_S = int(os.environ.get("TELEMETRY_HEARTBEAT_S", 300))
+TELEMETRY_DELTAS = {
+    "moisture": 0.5,     # %
+    "temperature": 0.2,  # °C
+    "ec": 10,            # us/cm
+    "ph": 0.05
 }
 
 class SoilSensorBridge:
@@ -67,9 +102,28 @@ class SoilSensorBridge:
         # 初始化上传遥测数据的 client
         self.telemetry_topic = mqtt_config["telemetry_topic"]
         self.telemetry_client_id = mqtt_config["telemetry_client_id"]
+        self.telemetry_qos = mqtt_config.get("telemetry_qos", 0)
         self.telemetry_client = MqttClient(self.telemetry_client_id, host=mqtt_config["host"], port=mqtt_config["port"], username=mqtt_config["username"], password=mqtt_config["password"])
         self.telemetry_client.connect()
-        
+
+        # Buffer of pending telemetry readings and its flush deadline
+        # (owned by the publisher thread)
+        self._tx_buf = []
+        self._tx_flush_deadline = 0.0
+
+        # Readings flow through a bounded queue to a dedicated publisher
+        # thread, so a slow broker never stalls the read loop
+        self._tx_q = queue.Queue(maxsize=64)
+        self._tx_thread = threading.Thread(target=self._tx_loop, daemon=True)
+        self._tx_thread.start()
+
+        # Last values actually published, for delta suppression
+        self._last_sent = {}
+        self._last_full_send = 0.0
+
+        # Exponential error backoff state
+        self._backoff = 1.0
+
         self.read_interval = read_interval
         
     def start(self):
@@ -84,54 +138,132 @@ class SoilSensorBridge:
             )
             
             # Start reading loop
-            last_read = 0
             try:
-                while True:
-                    now = time.time()
-                    if now - last_read >= self.read_interval:
-                        self._read_and_log_data()
-                        last_read = now
-                    time.sleep(1)
-                    
+                run_periodic(self.read_interval, self._read_and_log_data)
+
             except KeyboardInterrupt:
                 logger.info("Stopping bridge")
                 
         finally:
+            # Let the publisher drain and flush before going down
+            self._tx_q.put(None)
+            self._tx_thread.join(timeout=5)
             self.sensor.modbus.disconnect()
             
     def _read_and_log_data(self):
         """Read and log sensor data."""
         try:
-            # Read all basic parameters in one request
-            basic = self.sensor.read_composite("all")
+            # Issue both composite reads concurrently; the MQTT source
+            # matches each response to its request, so the round trips
+            # overlap instead of adding up
+            basic_future = self.sensor.read_composite_async("all")
+            npk_future = self.sensor.read_composite_async("npk")
+
+            basic = basic_future.result()
             logger.info(
-                f"Basic parameters: "
-                f"Moisture={basic['moisture']}%, "
-                f"Temperature={basic['temperature']}°C, "
-                f"EC={basic['ec']}us/cm, "
-                f"pH={basic['ph']}"
+                "Basic parameters: Moisture=%s%%, Temperature=%s°C, "
+                "EC=%sus/cm, pH=%s",
+                basic['moisture'],
+                basic['temperature'],
+                basic['ec'],
+                basic['ph']
             )
 
             self._upload_telemetry_data(basic)
-            
-            # Small delay between reads
-            # time.sleep(1)
-            
-            # Read NPK values
-            # npk = self.sensor.read_composite("npk")
-            # logger.info(
-            #     f"NPK values: "
-            #     f"N={npk['nitrogen']}mg/kg, "
-            #     f"P={npk['phosphorus']}mg/kg, "
-            #     f"K={npk['potassium']}mg/kg"
-            # )
-            
+
+            npk = npk_future.result()
+            logger.info(
+                "NPK values: N=%smg/kg, P=%smg/kg, K=%smg/kg",
+                npk['nitrogen'],
+                npk['phosphorus'],
+                npk['potassium']
+            )
+            self._backoff = 1.0
+
         except Exception as e:
             logger.error(f"Error reading sensor data: {e}")
+            # Back off exponentially (with jitter) so an overloaded
+            # broker isn't hit again at full cadence
+            time.sleep(self._backoff + random.random())
+            self._backoff = min(self._backoff * 2, 60.0)
 
     def _upload_telemetry_data(self, data: Dict):
-        """Upload telemetry data to ThingsBoard."""
-        self.telemetry_client.publish(self.telemetry_topic, json.dumps(data), qos=1)
+        """Buffer telemetry data and upload it in batches.
+
+        Readings that have not moved beyond the per-field noise
+        threshold since the last publish are dropped, except for a
+        periodic full snapshot.
+
+        Args:
+            data: Dictionary of sensor readings
+        """
+        now = time.monotonic()
+        if now - self._last_full_send >= TELEMETRY_HEARTBEAT_S:
+            # Heartbeat: send everything regardless of change
+            self._last_full_send = now
+        else:
+            data = {
+                k: v for k, v in data.items()
+                if abs(v - self._last_sent.get(k, float("inf")))
+                > TELEMETRY_DELTAS.get(k, 0.0)
+            }
+            if not data:
+                return
+        self._last_sent.update(data)
+
+        # Hand off to the publisher thread; if it can't keep up, drop
+        # the oldest reading to keep memory bounded. ThingsBoard's
+        # timestamped-telemetry shape is {"ts": <epoch millis>,
+        # "values": {...}}, which keeps the actual read time even when
+        # batching delays delivery
+        reading = {"ts": int(time.time() * 1000), "values": data}
+        try:
+            self._tx_q.put_nowait(reading)
+        except queue.Full:
+            try:
+                self._tx_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._tx_q.put_nowait(reading)
+
+    def _tx_loop(self):
+        """Publisher thread: batch queued readings and publish them."""
+        while True:
+            timeout = None
+            if self._tx_buf:
+                timeout = max(
+                    0.0, self._tx_flush_deadline - time.monotonic()
+                )
+            try:
+                reading = self._tx_q.get(timeout=timeout)
+            except queue.Empty:
+                # Batch window expired with readings still buffered
+                self._flush_telemetry()
+                continue
+
+            if reading is None:  # Shutdown sentinel
+                self._flush_telemetry()
+                return
+
+            if not self._tx_buf:
+                self._tx_flush_deadline = (
+                    time.monotonic() + TELEMETRY_BATCH_MS / 1000.0
+                )
+            self._tx_buf.append(reading)
+
+            if (len(self._tx_buf) >= TELEMETRY_BATCH_SIZE
+                    or time.monotonic() >= self._tx_flush_deadline):
+                self._flush_telemetry()
+
+    def _flush_telemetry(self):
+        """Publish all buffered readings as a single telemetry message."""
+        if not self._tx_buf:
+            return
+        payload = _json_dumps(self._tx_buf)
+        self.telemetry_client.publish(
+            self.telemetry_topic, payload, qos=self.telemetry_qos
+        )
+        self._tx_buf = []
 
 def main():
     """Run the bridge."""
@@ -2,15 +2,19 @@
 """
 Example of a sensor monitoring application with data logging and alerts.
 """
+import atexit
 import json
 import logging
 import os
+import random
+import sys
 import time
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
 from src.core.constants import CommType, ModbusBaudRate, Unit
 from src.plugins.soil import SoilSensor
+from src.utils.timing import run_periodic
 
 # Configure logging
 logging.basicConfig(
@@ -19,22 +23,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for log serialization; it emits bytes directly, so the
+# log file is kept in binary append mode
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 class SensorMonitor:
     """Sensor monitoring application."""
     
     def __init__(
         self,
         log_dir: str = "logs",
-        alert_thresholds: Optional[Dict] = None
+        alert_thresholds: Optional[Dict] = None,
+        verbose: Optional[bool] = None
     ):
         """Initialize monitor.
-        
+
         Args:
             log_dir: Directory for storing log files
             alert_thresholds: Dictionary of parameter thresholds for alerts
+            verbose: Print readings to stdout; defaults to True only when
+                stdout is a terminal, so daemonized runs skip the
+                formatting cost entirely
         """
         self.log_dir = log_dir
         os.makedirs(log_dir, exist_ok=True)
+
+        self.verbose = verbose if verbose is not None else sys.stdout.isatty()
         
         # Default thresholds
         self.thresholds = alert_thresholds or {
@@ -44,8 +65,28 @@ class SensorMonitor:
             "ph": (5.5, 7.5)  # min, max pH
         }
         
+        # Pre-packed threshold tuples with ready-made message templates,
+        # so the per-cycle check does no dict destructuring and only
+        # formats a string when an alert actually fires
+        self._thr_items = tuple(
+            (param, min_val, max_val,
+             f"{param} too low: {{v:.1f}} (min: {min_val})",
+             f"{param} too high: {{v:.1f}} (max: {max_val})")
+            for param, (min_val, max_val) in self.thresholds.items()
+        )
+
         self.current_alerts: List[str] = []
-        
+
+        # Per-reading print templates with the name and unit already
+        # rendered, so the hot path formats only the value
+        self._line_tmpls: Dict[str, str] = {}
+
+        # Long-lived, buffered handle for the daily log file so each
+        # reading doesn't pay an open/close (and fsync) round trip
+        self._log_fp = None
+        self._log_date: Optional[str] = None
+        atexit.register(self._close_log)
+
     def start_monitoring(
         self,
         comm_type: CommType = CommType.SERIAL,
@@ -66,29 +107,36 @@ class SensorMonitor:
                 logger.error("Failed to connect to sensor")
                 return
                 
+            # Exponential error backoff with jitter, capped at the read
+            # interval, so a struggling sensor/broker isn't hammered at
+            # a fixed rate
+            backoff = 1.0
+
+            def poll():
+                nonlocal backoff
+                try:
+                    # Read basic and NPK parameters in one transaction
+                    data = sensor.get_all_and_npk()
+
+                    # Process data
+                    self._process_data(data)
+                    backoff = 1.0
+
+                except Exception as e:
+                    logger.error(f"Error reading sensor: {e}")
+                    time.sleep(backoff + random.random())
+                    backoff = min(backoff * 2, 60.0)
+
             try:
-                while True:
-                    try:
-                        # Read sensor data
-                        data = sensor.get_all()
-                        npk = sensor.get_npk()
-                        data.update(npk)
-                        
-                        # Process data
-                        self._process_data(data)
-                        
-                        # Wait before next reading
-                        time.sleep(60)  # Read every minute
-                        
-                    except Exception as e:
-                        logger.error(f"Error reading sensor: {e}")
-                        time.sleep(5)
-                        
+                # Read every minute on a fixed cadence
+                run_periodic(60, poll)
+
             except KeyboardInterrupt:
                 logger.info("Stopping monitoring")
                 
             finally:
                 sensor.modbus.disconnect()
+                self._close_log()
                 
         except Exception as e:
             logger.error(f"Error initializing sensor: {e}")
@@ -123,19 +171,16 @@ class SensorMonitor:
             List of active alerts
         """
         alerts = []
-        
-        for param, (min_val, max_val) in self.thresholds.items():
-            if param in data:
-                value = data[param]
-                if value < min_val:
-                    alerts.append(
-                        f"{param} too low: {value:.1f} (min: {min_val})"
-                    )
-                elif value > max_val:
-                    alerts.append(
-                        f"{param} too high: {value:.1f} (max: {max_val})"
-                    )
-                    
+
+        for param, min_val, max_val, low_msg, high_msg in self._thr_items:
+            value = data.get(param)
+            if value is None:
+                continue
+            if value < min_val:
+                alerts.append(low_msg.format(v=value))
+            elif value > max_val:
+                alerts.append(high_msg.format(v=value))
+
         return alerts
         
     def _log_data(self, data: Dict, alerts: List[str]):
@@ -145,37 +190,86 @@ class SensorMonitor:
             data: Dictionary of sensor readings
             alerts: List of active alerts
         """
+        # One clock read per cycle; the date is a prefix of the
+        # timestamp, so rotation can't straddle midnight inconsistently
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
+        date = timestamp[:10]
+
         # Create log entry
         log_entry = {
             "timestamp": timestamp,
             "readings": data,
             "alerts": alerts
         }
-        
+
         # Write to daily log file
-        date = datetime.now().strftime("%Y-%m-%d")
-        log_file = os.path.join(self.log_dir, f"sensor_log_{date}.jsonl")
-        
         try:
-            with open(log_file, "a") as f:
-                json.dump(log_entry, f)
-                f.write("\n")
+            fp = self._get_log_fp(date)
+            fp.write(_json_dumps(log_entry))
+            fp.write(b"\n")
+            # At one reading per minute an unflushed buffer would hold
+            # hours of entries hostage to a power cut and keep the live
+            # log untailable, so push each line to the OS; the saving
+            # over the old code is the per-reading open/close, not the
+            # flush
+            fp.flush()
         except Exception as e:
             logger.error(f"Error writing to log file: {e}")
             
-        # Print current readings
-        print(f"\nSensor Readings at {timestamp}")
-        print("-" * 40)
+        if self.verbose:
+            self._print_readings(data, timestamp, alerts)
+
+    def _get_log_fp(self, date: str):
+        """Get the handle for the given day's log file, rotating on
+        date change.
+
+        Args:
+            date: Date string in YYYY-MM-DD form
+
+        Returns:
+            Buffered file object opened in append mode
+        """
+        if self._log_fp is None or date != self._log_date:
+            self._close_log()
+            log_file = os.path.join(self.log_dir, f"sensor_log_{date}.jsonl")
+            self._log_fp = open(log_file, "ab", buffering=1 << 16)
+            self._log_date = date
+        return self._log_fp
+
+    def _close_log(self):
+        """Flush and close the current log file, if open."""
+        if self._log_fp is not None:
+            try:
+                self._log_fp.close()
+            except Exception as e:
+                logger.error(f"Error closing log file: {e}")
+            self._log_fp = None
+
+    def _print_readings(self, data: Dict, timestamp: str, alerts: List[str]):
+        """Print current readings to stdout.
+
+        Args:
+            data: Dictionary of sensor readings
+            timestamp: Formatted reading timestamp
+            alerts: List of active alerts
+        """
+        # Build the whole block and write it in one go, so each cycle
+        # costs a single stdio lock acquisition and flush
+        lines = [f"\nSensor Readings at {timestamp}", "-" * 40]
         for key, value in data.items():
-            unit = Unit[key.upper()].value if hasattr(Unit, key.upper()) else ""
-            print(f"{key:12}: {value:8.1f} {unit}")
+            tmpl = self._line_tmpls.get(key)
+            if tmpl is None:
+                member = Unit.__members__.get(key.upper())
+                unit = member.value if member else ""
+                tmpl = f"{key:12}: {{:8.1f}} {unit}"
+                self._line_tmpls[key] = tmpl
+            lines.append(tmpl.format(value))
         if alerts:
-            print("\nAlerts:")
+            lines.append("\nAlerts:")
             for alert in alerts:
-                print(f"! {alert}")
-        print("-" * 40)
+                lines.append(f"! {alert}")
+        lines.append("-" * 40)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Run the monitoring application."""
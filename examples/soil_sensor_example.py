@@ -3,6 +3,7 @@
 Example script demonstrating the usage of the soil sensor library.
 """
 import logging
+import sys
 import time
 from typing import Dict
 
@@ -16,17 +17,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Unit strings and capitalized field names resolved once at import,
+# instead of a hasattr + Enum lookup + capitalize per row per call
+_UNIT_BY_KEY = {u.name.lower(): u.value for u in Unit}
+_LABEL_BY_KEY = {key: key.capitalize() for key in _UNIT_BY_KEY}
+
 def print_sensor_data(data: Dict) -> None:
     """Print sensor data in a formatted way."""
-    print("\nSensor Readings:")
-    print("-" * 40)
+    rows = ["\nSensor Readings:", "-" * 40]
     for key, value in data.items():
+        label = _LABEL_BY_KEY.get(key) or key.capitalize()
         if isinstance(value, (int, float)):
-            unit = Unit[key.upper()].value if hasattr(Unit, key.upper()) else ""
-            print(f"{key.capitalize():12}: {value:8.2f} {unit}")
+            rows.append(f"{label:12}: {value:8.2f} {_UNIT_BY_KEY.get(key, '')}")
         else:
-            print(f"{key.capitalize():12}: {value}")
-    print("-" * 40)
+            rows.append(f"{label:12}: {value}")
+    rows.append("-" * 40)
+    # One write keeps the whole block in a single stdout syscall
+    sys.stdout.write("\n".join(rows) + "\n")
 
 def serial_example():
     """Example using serial communication."""
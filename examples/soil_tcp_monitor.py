@@ -9,16 +9,20 @@ This example demonstrates:
 import csv
 import logging
 import os
+import queue
+import socket
 import sys
 import json
 import time
 import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable
 from dotenv import load_dotenv
 
-from src.core.constants import CommType, SoilRegister, Unit, DEFAULT_MODBUS_TCP_PORT, ModbusFunction
+from src.core.constants import AirRegister, CommType, SoilRegister, Unit, DEFAULT_MODBUS_TCP_PORT, ModbusFunction
 from src.plugins.soil import SoilSensor, SOIL_SENSOR_CONFIG
 from src.plugins.air import AirSensor, AIR_SENSOR_CONFIG
 from src.core.modbus import ModbusAdapter, ModbusTCPSource, ModbusDataSource
@@ -31,6 +35,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for payload serialization; it returns bytes, which
+# requests accepts directly as the request body
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 # TCP Configuration from environment variables
 TCP_CONFIG = {
     "host": os.environ.get("MODBUS_HOST", "192.168.2.73"),  # Replace with your Modbus TCP server IP
@@ -58,15 +73,20 @@ class SoilAndAirMonitor:
         """
         
         # 创建共享的Modbus TCP客户端
+        # 短超时让断链在一个周期内暴露出来，而不是每次默默等满10秒
         self.tcp_client = ModbusTcpClient(
             host=tcp_config["host"],
-            port=tcp_config["port"]
+            port=tcp_config["port"],
+            timeout=float(os.environ.get("MODBUS_TIMEOUT", 2))
         )
-        # 创建锁，确保同一时间只有一个请求在处理中
-        self.modbus_lock = threading.Lock()
-        
-        # 创建ModbusTCPSource，使用共享客户端
-        tcp_source = ModbusTCPSource(
+
+        # 连续失败计数，驱动重连的指数退避
+        self._fail_count = 0
+        # Set to stop the monitoring loop from another thread
+        self._stop = threading.Event()
+
+        # 创建ModbusTCPSource，使用共享客户端；保留引用用于批量读取
+        self.tcp_source = tcp_source = ModbusTCPSource(
             host=tcp_config["host"],
             port=tcp_config["port"],
             client=self.tcp_client
@@ -92,7 +112,85 @@ class SoilAndAirMonitor:
         self.host = tcp_config["host"]
         self.port = tcp_config["port"]
         self.api_url = api_url
-        
+
+        # 每组寄存器独立的扫描周期：土壤参数漂移很慢，可以比空气组
+        # 扫得更稀疏；未到期的组用上次缓存的值填充上报数据
+        self._group_intervals = {
+            "soil": float(os.environ.get("SOIL_READ_INTERVAL", read_interval)),
+            "air": float(os.environ.get("AIR_READ_INTERVAL", read_interval)),
+        }
+        self._next_due = {"soil": 0.0, "air": 0.0}
+        self._last_values = {"soil": {}, "air": {}}
+
+        # 上次实际POST的数据快照：读数在容差内没有变化时跳过整个
+        # HTTP往返，但超过 max_publish_age 秒后无条件发一次全量数据，
+        # 避免服务端把设备当成掉线
+        self._last_sent = {}
+        self._last_sent_ts = 0.0
+        self.max_publish_age = float(os.environ.get("MAX_PUBLISH_AGE", 300))
+        # 按字段后缀配置的变化容差（soil_/air_ 前缀共用）
+        self._post_tols = {
+            "moisture": 0.1,     # %
+            "humidity": 0.1,     # %
+            "temperature": 0.05, # °C
+            "ec": 5,             # us/cm
+            "ph": 0.02,
+            "co2": 5,            # ppm
+            "light": 50,         # lux
+        }
+
+        # 温度误差校正，启动时解析一次，避免每个周期读取环境变量
+        self.soil_temp_diff = float(os.environ.get("SOIL_TEMP_DIFF", 0))
+        self.air_temp_diff = float(os.environ.get("AIR_TEMP_DIFF", 0))
+
+        # 复用同一个HTTP会话：连接池保持TCP/TLS连接，替代每次新建连接
+        self.http = requests.Session()
+        self.http.trust_env = False  # 明确禁用代理
+        self.http.headers.update({
+            'Content-Type': 'application/json',
+            'User-Agent': 'SoilAndAirMonitor/1.0',
+            'Accept': '*/*'
+        })
+        retry = Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504]
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=1,
+            max_retries=retry
+        )
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
+        # CSV日志：进程生命周期内保持同一个文件句柄增量追加，而不是
+        # 每个周期open+write+close；每10行flush一次，避免嵌入式闪存上
+        # 的fsync风暴
+        self.csv_path = os.environ.get("CSV_LOG_PATH", "sensor_data.csv")
+        csv_fields = (
+            ["timestamp"]
+            + [f"soil_{k}" for k in ("moisture", "temperature", "ec", "ph")]
+            + [f"air_{k}" for k in ("humidity", "temperature", "co2", "light")]
+        )
+        write_header = (
+            not os.path.exists(self.csv_path)
+            or os.path.getsize(self.csv_path) == 0
+        )
+        self._csv_fp = open(self.csv_path, "a", newline="", buffering=1 << 14)
+        self._csv = csv.DictWriter(
+            self._csv_fp, fieldnames=csv_fields, restval="", extrasaction="ignore"
+        )
+        if write_header:
+            self._csv.writeheader()
+        self._csv_rows_since_flush = 0
+
+        # POST发送移到后台线程：读取循环只入队，慢速/超时的HTTP请求
+        # 不再拖慢下一次传感器采样
+        self._post_q = queue.Queue(maxsize=8)
+        self._post_thread = threading.Thread(target=self._post_worker, daemon=True)
+        self._post_thread.start()
+
     def start(self):
         """Start monitoring."""
         connected = False
@@ -102,6 +200,7 @@ class SoilAndAirMonitor:
             logger.info(f"Connecting to Modbus TCP server at {self.host}:{self.port}...")
             if self.tcp_client.connect():
                 connected = True
+                self._apply_socket_opts(self.tcp_client)
                 logger.info("Connected to Modbus TCP server")
             else:
                 logger.error("Failed to connect to Modbus TCP server")
@@ -113,20 +212,27 @@ class SoilAndAirMonitor:
             else:
                 logger.warning("No API URL provided. Data will not be sent to HTTP endpoint.")
             
-            # Start monitoring loop
-            last_read = 0
+            # Start monitoring loop: sleep until the next monotonic
+            # deadline instead of waking every second, and let stop()
+            # break the wait immediately
+            next_read = time.monotonic()
             try:
-                while True:
-                    now = time.time()
-                    if now - last_read >= self.read_interval:
-                        self._read_and_process_data()
-                        last_read = now
-                    time.sleep(1)
-                    
+                while not self._stop.is_set():
+                    self._read_and_process_data()
+                    next_read += self.read_interval
+                    self._stop.wait(max(0, next_read - time.monotonic()))
+
             except KeyboardInterrupt:
                 logger.info("Stopping monitoring")
                 
         finally:
+            # Let the worker drain any queued payloads before going down
+            self._post_q.put(None)
+            self._post_thread.join(timeout=15)
+            try:
+                self._csv_fp.close()
+            except Exception as e:
+                logger.error(f"Error closing CSV log: {e}")
             if connected:
                 logger.info("Disconnecting from Modbus TCP server...")
                 try:
@@ -135,86 +241,256 @@ class SoilAndAirMonitor:
                 except Exception as e:
                     logger.error(f"Error disconnecting: {e}")
             
+    def stop(self):
+        """Stop the monitoring loop."""
+        self._stop.set()
+
+    def _apply_socket_opts(self, client):
+        """Tune the Modbus TCP socket for request/response polling.
+
+        Disables Nagle's algorithm (which can delay small request frames
+        by tens of milliseconds waiting to coalesce them) and enables
+        TCP keepalive so dead gateways are noticed. pymodbus exposes the
+        socket differently across versions, so failures are non-fatal.
+
+        Args:
+            client: Connected ModbusTcpClient instance
+        """
+        try:
+            sock = getattr(client, "socket", None)
+            if sock is None:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+            # Large enough to absorb back-to-back batched responses
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+            self._apply_quickack(sock)
+        except Exception as e:
+            logger.warning(f"Could not tune Modbus socket: {e}")
+
+    def _ensure_connected(self) -> bool:
+        """Check socket health, reconnecting with backoff if needed.
+
+        A transaction error can leave the socket in an undefined state;
+        without this check every subsequent poll would fail and pay the
+        full timeout. Backoff doubles per consecutive failure, capped at
+        30 s, and the wait is interruptible by stop().
+
+        Returns:
+            True if the connection is usable
+        """
+        if self.tcp_client.is_socket_open():
+            return True
+        delay = min(30, 2 ** self._fail_count)
+        logger.warning("Modbus connection lost, reconnecting in %ss", delay)
+        if self._stop.wait(delay):
+            return False
+        if self.tcp_client.connect():
+            self._fail_count = 0
+            self._apply_socket_opts(self.tcp_client)
+            logger.info("Reconnected to Modbus TCP server")
+            return True
+        self._fail_count += 1
+        return False
+
+    def _apply_quickack(self, sock=None):
+        """Re-arm TCP_QUICKACK on the Modbus socket (Linux only).
+
+        Delayed ACKs can add ~40 ms to small Modbus response bursts;
+        QUICKACK suppresses them but the kernel resets the flag after
+        use, so it is re-applied after each poll cycle.
+
+        Args:
+            sock: Socket to tune; defaults to the shared client's socket
+        """
+        if not sys.platform.startswith("linux") or not hasattr(socket, "TCP_QUICKACK"):
+            return
+        try:
+            if sock is None:
+                sock = getattr(self.tcp_client, "socket", None)
+                if sock is None:
+                    return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+        except Exception as e:
+            logger.debug(f"Could not set TCP_QUICKACK: {e}")
+
     def _read_and_process_data(self):
         """Read, process, and log sensor data."""
         soil_data = {}
         air_data = {}
-        
-        # 读取土壤传感器数据
-        try:
-            soil_data = self.soil_sensor.read_composite("all")
 
-            
-            soild_temp_diff = os.environ.get("SOIL_TEMP_DIFF", 0)
-            # 处理温度误差
-            ori_soild_temp = soil_data["temperature"] 
-            soil_data["temperature"] = soil_data["temperature"] + float(soild_temp_diff)
-            logger.info(
-                f"Soil Data: "
-                f"Moisture={soil_data['moisture']}%, "
-                f"Temperature={soil_data['temperature']}°C, "
-                f"EC={soil_data['ec']}us/cm, "
-                f"pH={soil_data['ph']}"
-                f"ORI_TEMP={ori_soild_temp}°C"
-            )
-        except Exception as e:
-            logger.error(f"Error reading soil sensor data: {e}")
-            
-        # 读取空气传感器数据
-        try:
-            air_data = self.air_sensor.read_composite("all")
-
-            air_temp_diff = os.environ.get("AIR_TEMP_DIFF", 0)
-
-            # 处理温度误差
-            ori_air_temp = air_data["temperature"] 
-            air_data["temperature"] = air_data["temperature"] + float(air_temp_diff)
-            logger.info(
-                f"Air Data: "
-                f"Humidity={air_data['humidity']}%, "
-                f"Temperature={air_data['temperature']}°C, "
-                f"CO2={air_data['co2']}ppm, "
-                f"Light={air_data['light']}lux"
-                f"ORI_TEMP={ori_air_temp}°C"
-            )
-        except Exception as e:
-            logger.error(f"Error reading air sensor data: {e}")
+        # 只读取到期的寄存器组；未到期的组稍后用缓存值填充
+        now = time.monotonic()
+        batch = []
+        if self._next_due["soil"] <= now:
+            batch.append(("soil", (self.soil_sensor.unit_id, SoilRegister.MOISTURE, 4)))
+        if self._next_due["air"] <= now:
+            batch.append(("air", (self.air_sensor.unit_id, AirRegister.HUMIDITY, 5)))
+
+        # 两个传感器挂在同一网关上：把到期的寄存器块放进一次批量请求，
+        # 在共享连接上背靠背发出，省掉每次调用的连接检查和适配层开销
+        soil_regs = air_regs = None
+        if batch and self._ensure_connected():
+            try:
+                values = self.tcp_source.read_many([req for _, req in batch])
+                blocks = dict(zip((group for group, _ in batch), values))
+                soil_regs = blocks.get("soil")
+                air_regs = blocks.get("air")
+                self._fail_count = 0
+                # QUICKACK resets after each use; re-arm for the next poll
+                self._apply_quickack()
+            except Exception as e:
+                logger.error(f"Error reading sensor data: {e}")
+                self._fail_count += 1
+
+        # 解析土壤传感器数据
+        if soil_regs is not None:
+            try:
+                soil_data = {
+                    k: round(v, 2) if isinstance(v, float) else v
+                    for k, v in self.soil_sensor.custom_soil_all(soil_regs).items()
+                }
+
+                # 处理温度误差
+                ori_soild_temp = soil_data["temperature"]
+                soil_data["temperature"] = soil_data["temperature"] + self.soil_temp_diff
+                # %-style args are only formatted if INFO is enabled
+                logger.info(
+                    "Soil Data: Moisture=%s%%, Temperature=%s°C, "
+                    "EC=%sus/cm, pH=%sORI_TEMP=%s°C",
+                    soil_data['moisture'],
+                    soil_data['temperature'],
+                    soil_data['ec'],
+                    soil_data['ph'],
+                    ori_soild_temp
+                )
+                self._last_values["soil"] = soil_data
+                self._next_due["soil"] = now + self._group_intervals["soil"]
+            except Exception as e:
+                logger.error(f"Error reading soil sensor data: {e}")
+                soil_data = {}
+
+        # 解析空气传感器数据
+        if air_regs is not None:
+            try:
+                air_data = {
+                    k: round(v, 2) if isinstance(v, float) else v
+                    for k, v in self.air_sensor.custom_air_all(air_regs).items()
+                }
+
+                # 处理温度误差
+                ori_air_temp = air_data["temperature"]
+                air_data["temperature"] = air_data["temperature"] + self.air_temp_diff
+                logger.info(
+                    "Air Data: Humidity=%s%%, Temperature=%s°C, "
+                    "CO2=%sppm, Light=%sluxORI_TEMP=%s°C",
+                    air_data['humidity'],
+                    air_data['temperature'],
+                    air_data['co2'],
+                    air_data['light'],
+                    ori_air_temp
+                )
+                self._last_values["air"] = air_data
+                self._next_due["air"] = now + self._group_intervals["air"]
+            except Exception as e:
+                logger.error(f"Error reading air sensor data: {e}")
+                air_data = {}
         
+        # 只有因未到期而被主动跳过的组才用缓存镜像填充，保证上报数据
+        # 完整；真正读取失败的组保持为空，避免把过期读数当新数据上报
+        if not soil_data and self._next_due["soil"] > now:
+            soil_data = self._last_values["soil"]
+        if not air_data and self._next_due["air"] > now:
+            air_data = self._last_values["air"]
+
         # Only proceed if we have at least some data
         if soil_data or air_data:
-            # Add prefixes to distinguish data sources
-            soil_data_with_prefix = {f"soil_{k}": v for k, v in soil_data.items()}
-            air_data_with_prefix = {f"air_{k}": v for k, v in air_data.items()}
-            
-            # Combine data
-            combined_data = {**soil_data_with_prefix, **air_data_with_prefix}
-            
-            # Send data via HTTP POST
+            # Prefix the keys while writing straight into the combined
+            # payload: one dict allocation instead of three (plain
+            # string + beats an f-string at two tokens)
+            combined_data = {}
+            for k, v in soil_data.items():
+                combined_data["soil_" + k] = v
+            for k, v in air_data.items():
+                combined_data["air_" + k] = v
+
+            # 记录到CSV（即使POST被抑制也记录完整历史）
+            try:
+                self._csv.writerow({
+                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    **combined_data
+                })
+                self._csv_rows_since_flush += 1
+                if self._csv_rows_since_flush >= 10:
+                    self._csv_fp.flush()
+                    self._csv_rows_since_flush = 0
+            except Exception as e:
+                logger.error(f"Error writing CSV log: {e}")
+
+            # Send data via HTTP POST (queued to the background worker)
             if self.api_url:
+                if not self._should_publish(combined_data):
+                    logger.info("Readings unchanged within tolerance, skipping POST")
+                    return
+                self._last_sent = dict(combined_data)
+                self._last_sent_ts = time.monotonic()
+                data = _json_dumps(combined_data)
                 try:
-                    headers = {
-                        'Content-Type': 'application/json',
-                        'User-Agent': 'SoilAndAirMonitor/1.0',
-                        'Accept': '*/*'
-                    }
-                    
-                    # 使用 data 参数而不是 json 参数，更接近 curl 的行为
-                    data = json.dumps(combined_data)
-
-                    response = requests.post(
-                        url=self.api_url,
-                        data=data,
-                        headers=headers,
-                        timeout=10,
-                        proxies={'http': None, 'https': None}  # 明确禁用代理
-                    )
-                    
-                    if response.status_code == 200:
-                        logger.info(f"Data sent to HTTP endpoint successfully")
-                    else:
-                        logger.error(f"Failed to send data to HTTP endpoint. Status code: {response.status_code}")
-                except Exception as e:
-                    logger.error(f"Error sending data to HTTP endpoint: {e}")
+                    self._post_q.put_nowait(data)
+                except queue.Full:
+                    # 端点长时间不可达时丢弃本次数据，保证内存有界，
+                    # 下一个周期的数据会覆盖它
+                    logger.warning("POST queue full, dropping this reading")
+
+    def _should_publish(self, combined_data: Dict[str, Any]) -> bool:
+        """Decide whether the combined payload is worth a POST.
+
+        Args:
+            combined_data: Prefixed soil/air readings about to be sent
+
+        Returns:
+            True if any field moved beyond its tolerance, a field
+            appeared or disappeared, or the last publish is older than
+            max_publish_age
+        """
+        if time.monotonic() - self._last_sent_ts >= self.max_publish_age:
+            return True
+        if combined_data.keys() != self._last_sent.keys():
+            return True
+        for key, value in combined_data.items():
+            # soil_temperature / air_temperature share the tolerance
+            # configured for the bare "temperature" suffix
+            tol = self._post_tols.get(key.split("_", 1)[-1], 0.0)
+            if abs(value - self._last_sent[key]) > tol:
+                return True
+        return False
+
+    def _post_worker(self):
+        """Background thread: POST queued payloads to the HTTP endpoint.
+
+        Runs until a None sentinel is received, so a slow or timing-out
+        endpoint only delays uploads, never sensor reads.
+        """
+        while True:
+            data = self._post_q.get()
+            if data is None:
+                return
+            try:
+                # 使用 data 参数而不是 json 参数，更接近 curl 的行为
+                response = self.http.post(
+                    url=self.api_url,
+                    data=data,
+                    timeout=10
+                )
+
+                if response.status_code == 200:
+                    logger.info("Data sent to HTTP endpoint successfully")
+                else:
+                    logger.error(f"Failed to send data to HTTP endpoint. Status code: {response.status_code}")
+            except Exception as e:
+                logger.error(f"Error sending data to HTTP endpoint: {e}")
 
 
 def main():
@@ -2,7 +2,15 @@
 Core functionality for sensor communication and management.
 """
 
-from .constants import *
+# Explicit imports instead of `from .constants import *`: only the
+# symbols actually re-exported are bound, keeping the module dict small
+# and cold start cheap for every script that imports src.core
+from .constants import (CommType, ModbusBaudRate, ModbusDataType,
+                        RegisterType, Unit, SoilRegister, AirRegister,
+                        ModbusFunction, ScaleFactor, DEFAULT_TIMEOUT,
+                        DEFAULT_MODBUS_TCP_PORT, DEFAULT_MQTT_PORT,
+                        DEFAULT_MQTT_QOS, DEFAULT_BYTESIZE,
+                        DEFAULT_PARITY, DEFAULT_STOPBITS)
 from .modbus import ModbusAdapter, ModbusSerialSource, ModbusMqttSource
 from .mqtt import MqttClient
 from .sensor import BaseSensor
@@ -12,5 +20,21 @@ __all__ = [
     'ModbusSerialSource',
     'ModbusMqttSource',
     'MqttClient',
-    'BaseSensor'
-] 
\ No newline at end of file
+    'BaseSensor',
+    'CommType',
+    'ModbusBaudRate',
+    'ModbusDataType',
+    'RegisterType',
+    'Unit',
+    'SoilRegister',
+    'AirRegister',
+    'ModbusFunction',
+    'ScaleFactor',
+    'DEFAULT_TIMEOUT',
+    'DEFAULT_MODBUS_TCP_PORT',
+    'DEFAULT_MQTT_PORT',
+    'DEFAULT_MQTT_QOS',
+    'DEFAULT_BYTESIZE',
+    'DEFAULT_PARITY',
+    'DEFAULT_STOPBITS'
+]
@@ -129,4 +129,25 @@ class AirRegister:
     
     # Device settings
     DEVICE_ADDR = 0x07D0  # 设备地址
-    BAUD_RATE = 0x07D1    # 设备波特率 
\ No newline at end of file
+    BAUD_RATE = 0x07D1    # 设备波特率
+
+# Frozen register metadata tables: (name, address, scale, signed) per
+# measurement register, ordered by address, so a contiguous block read
+# can be decoded by zipping the raw values with the table in one pass
+# instead of per-field class attribute lookups. The register classes
+# above stay as the compatibility API for addressing individual fields.
+SOIL_BASIC: Final = (
+    ("moisture", SoilRegister.MOISTURE, ScaleFactor.MOISTURE, True),
+    ("temperature", SoilRegister.TEMPERATURE, ScaleFactor.TEMPERATURE, True),
+    ("ec", SoilRegister.EC, ScaleFactor.EC, False),
+    ("ph", SoilRegister.PH, ScaleFactor.PH, False),
+    ("nitrogen", SoilRegister.NITROGEN, ScaleFactor.NPK, False),
+    ("phosphorus", SoilRegister.PHOSPHORUS, ScaleFactor.NPK, False),
+    ("potassium", SoilRegister.POTASSIUM, ScaleFactor.NPK, False),
+)
+
+AIR_BASIC: Final = (
+    ("humidity", AirRegister.HUMIDITY, ScaleFactor.HUMIDITY, False),
+    ("temperature", AirRegister.TEMPERATURE, ScaleFactor.TEMPERATURE, True),
+    ("co2", AirRegister.CO2, ScaleFactor.CO2, False),
+) 
\ No newline at end of file
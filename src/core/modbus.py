@@ -3,22 +3,81 @@ Modbus protocol adapter supporting both serial and MQTT data sources.
 """
 import logging
 import struct
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from array import array
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError, wait
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from pymodbus.client import ModbusSerialClient, ModbusTcpClient
 from pymodbus.exceptions import ModbusException
 
 from .constants import (CommType, DEFAULT_BYTESIZE, DEFAULT_MQTT_PORT,
                       DEFAULT_MQTT_QOS, DEFAULT_PARITY, DEFAULT_STOPBITS,
                       DEFAULT_TIMEOUT, DEFAULT_MODBUS_TCP_PORT, ModbusBaudRate, ModbusFunction,
                       ModbusDataType)
-from .mqtt import MqttClient
 from ..utils.modbus_tools import ModbusCommand, ModbusTools
 
+# Transport client classes (pymodbus clients, paho-backed MqttClient)
+# are imported lazily inside the source constructors: a device that
+# only uses one transport then never pays import time or RSS for the
+# others
+
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=32)
+def _register_struct(count: int) -> struct.Struct:
+    """Compiled big-endian decoder for `count` 16-bit registers.
+
+    Cached so the format string is parsed once per register count
+    instead of on every response.
+    """
+    return struct.Struct(f">{count}H")
+
+# Register-pair packer shared by the float read/write paths
+_STRUCT_HH = struct.Struct('>HH')
+
+# Max register gap bridged when coalescing reads: up to this many
+# filler registers are read and discarded to merge two runs into one
+# transaction
+_COALESCE_GAP = 8
+
+# Hot-path aliases for the per-message function codes: one global load
+# instead of an enum attribute walk per request/response
+_RHR = ModbusFunction.READ_HOLDING_REGISTERS
+_WSR = ModbusFunction.WRITE_SINGLE_REGISTER
+_WMR = ModbusFunction.WRITE_MULTIPLE_REGISTERS
+_READ_FUNC_VALUES = (ModbusFunction.READ_HOLDING_REGISTERS.value,
+                     ModbusFunction.READ_INPUT_REGISTERS.value)
+
+@lru_cache(maxsize=32)
+def _float_struct(byte_order: str) -> struct.Struct:
+    """Compiled converter for a caller-supplied float byte order."""
+    return struct.Struct(byte_order)
+
+# Function-code dispatch tables shared by the pymodbus-backed sources:
+# one dict lookup replaces the if/elif chain on every call, and new
+# function codes only need a new entry
+_READ_DISPATCH = {
+    ModbusFunction.READ_HOLDING_REGISTERS:
+        lambda client, address, count, unit:
+            client.read_holding_registers(address=address, count=count, slave=unit),
+    ModbusFunction.READ_INPUT_REGISTERS:
+        lambda client, address, count, unit:
+            client.read_input_registers(address=address, count=count, slave=unit),
+}
+
+_WRITE_DISPATCH = {
+    ModbusFunction.WRITE_SINGLE_REGISTER:
+        lambda client, address, value, unit:
+            client.write_register(address=address, value=value, slave=unit),
+    ModbusFunction.WRITE_MULTIPLE_REGISTERS:
+        lambda client, address, value, unit:
+            client.write_registers(address=address, values=[value], slave=unit),
+}
+
 class ModbusDataSource(ABC):
     """Abstract base class for Modbus data sources."""
     
@@ -54,9 +113,81 @@ class ModbusDataSource(ABC):
         """Write register to data source."""
         pass
 
+    def write_registers(
+        self,
+        address: int,
+        values: List[int],
+        unit: int
+    ) -> None:
+        """Write consecutive registers.
+
+        Sources that support Modbus function 0x10 override this with a
+        single multi-register transaction; the default falls back to
+        one write per register.
+        """
+        for offset, value in enumerate(values):
+            self.write_register(address + offset, value, unit)
+
+    def write_register_async(
+        self,
+        address: int,
+        value: int,
+        unit: int
+    ) -> Future:
+        """Write a register without blocking for completion.
+
+        The default runs the write synchronously and returns an
+        already-resolved Future; sources that can pipeline override
+        this to send immediately and resolve on response.
+        """
+        future = Future()
+        try:
+            self.write_register(address, value, unit)
+            future.set_result(None)
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+# Process-wide pool of serial clients keyed by port settings: adapters
+# sharing a port (or rebuilt per poll cycle) reuse one open client
+# instead of paying the port-open and framer-init cost each time
+_SERIAL_POOL: Dict[tuple, "ModbusSerialClient"] = {}
+_SERIAL_POOL_LOCK = threading.Lock()
+
+class _BusPacer:
+    """Serializes transactions on one RS-485 bus.
+
+    Several sensors polling through the same port contend for the
+    wire; the pacer makes each transaction wait its turn and then
+    honours the Modbus RTU 3.5-character silent interval after the
+    previous frame, so back-to-back polls of different slaves don't
+    collide mid-bus.
+    """
+
+    __slots__ = ('_lock', '_silent', '_last')
+
+    def __init__(self, silent: float):
+        self._lock = threading.Lock()
+        self._silent = silent
+        self._last = 0.0
+
+    def __enter__(self):
+        self._lock.acquire()
+        wait = self._last + self._silent - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._last = time.monotonic()
+        self._lock.release()
+
+# One pacer per serial device path, shared across pooled clients
+_BUS_PACERS: Dict[str, _BusPacer] = {}
+
 class ModbusSerialSource(ModbusDataSource):
     """Modbus RTU serial data source."""
-    
+
     def __init__(
         self,
         port: str,
@@ -68,27 +199,59 @@ class ModbusSerialSource(ModbusDataSource):
         client = None
     ):
         """Initialize serial data source."""
+        self._pooled = client is None
+        # 3.5-character silent interval (11 bits per character on the
+        # wire), floored at the spec's 1.75 ms for fast baud rates
+        silent = max(0.00175, 3.5 * 11 / baudrate.value)
+        with _SERIAL_POOL_LOCK:
+            pacer = _BUS_PACERS.get(port)
+            if pacer is None:
+                pacer = _BUS_PACERS[port] = _BusPacer(silent)
+        self._pacer = pacer
         if client is not None:
             # 如果传入了预先配置的客户端，直接使用
             self.client = client
         else:
-            # 否则，创建新的客户端
-            self.client = ModbusSerialClient(
-                port=port,
-                baudrate=baudrate.value,
-                bytesize=bytesize,
-                parity=parity,
-                stopbits=stopbits,
-                timeout=timeout,
-                framer='rtu'
-            )
-        
+            # 否则，从进程级连接池取（或创建）客户端，同一串口配置的
+            # 多个适配器实例共享同一个已打开的端口
+            from pymodbus.client import ModbusSerialClient
+
+            key = (port, baudrate.value, bytesize, parity, stopbits, timeout)
+            with _SERIAL_POOL_LOCK:
+                pooled = _SERIAL_POOL.get(key)
+                if pooled is None:
+                    pooled = ModbusSerialClient(
+                        port=port,
+                        baudrate=baudrate.value,
+                        bytesize=bytesize,
+                        parity=parity,
+                        stopbits=stopbits,
+                        timeout=timeout,
+                        framer='rtu'
+                    )
+                    _SERIAL_POOL[key] = pooled
+            self.client = pooled
+
     def connect(self) -> bool:
         return self.client.connect()
-        
+
     def disconnect(self) -> None:
-        self.client.close()
-        
+        # 池化的客户端可能被其他适配器共享，由 close_pool() 统一关闭
+        if not self._pooled:
+            self.client.close()
+
+    @staticmethod
+    def close_pool() -> None:
+        """Close every pooled serial client (for process shutdown)."""
+        with _SERIAL_POOL_LOCK:
+            clients = list(_SERIAL_POOL.values())
+            _SERIAL_POOL.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                logger.error(f"Error closing pooled serial client: {e}")
+
     def read_registers(
         self,
         address: int,
@@ -98,21 +261,12 @@ class ModbusSerialSource(ModbusDataSource):
     ) -> List[int]:
         """Read registers from serial device."""
         try:
-            if function_code == ModbusFunction.READ_HOLDING_REGISTERS:
-                response = self.client.read_holding_registers(
-                    address=address,
-                    count=count,
-                    slave=unit
-                )
-            elif function_code == ModbusFunction.READ_INPUT_REGISTERS:
-                response = self.client.read_input_registers(
-                    address=address,
-                    count=count,
-                    slave=unit
-                )
-            else:
+            read = _READ_DISPATCH.get(function_code)
+            if read is None:
                 raise ValueError(f"Unsupported function code: {function_code}")
-                
+            with self._pacer:
+                response = read(self.client, address, count, unit)
+
             if response and not response.isError():
                 return response.registers
             raise ModbusException(f"Failed to read register {address}")
@@ -129,25 +283,36 @@ class ModbusSerialSource(ModbusDataSource):
     ) -> None:
         """Write register to serial device."""
         try:
-            if function_code == ModbusFunction.WRITE_SINGLE_REGISTER:
-                response = self.client.write_register(
-                    address=address,
-                    value=value,
-                    slave=unit
-                )
-            elif function_code == ModbusFunction.WRITE_MULTIPLE_REGISTERS:
+            write = _WRITE_DISPATCH.get(function_code)
+            if write is None:
+                raise ValueError(f"Unsupported function code: {function_code}")
+            with self._pacer:
+                response = write(self.client, address, value, unit)
+
+            if response and response.isError():
+                raise ModbusException(f"Failed to write register {address}")
+        except Exception as e:
+            logger.error(f"Error writing register {address}: {e}")
+            raise
+
+    def write_registers(
+        self,
+        address: int,
+        values: List[int],
+        unit: int
+    ) -> None:
+        """Write consecutive registers in one function 0x10 transaction."""
+        try:
+            with self._pacer:
                 response = self.client.write_registers(
                     address=address,
-                    values=[value],
+                    values=list(values),
                     slave=unit
                 )
-            else:
-                raise ValueError(f"Unsupported function code: {function_code}")
-                
             if response and response.isError():
-                raise ModbusException(f"Failed to write register {address}")
+                raise ModbusException(f"Failed to write registers at {address}")
         except Exception as e:
-            logger.error(f"Error writing register {address}: {e}")
+            logger.error(f"Error writing registers at {address}: {e}")
             raise
 
 class ModbusMqttSource(ModbusDataSource):
@@ -162,10 +327,11 @@ class ModbusMqttSource(ModbusDataSource):
         port: int = DEFAULT_MQTT_PORT,
         username: Optional[str] = None,
         password: Optional[str] = None,
-        mqtt_client = None
+        mqtt_client = None,
+        qos: int = 0
     ):
         """Initialize MQTT data source.
-        
+
         Args:
             client_id: MQTT client ID
             request_topic: Topic for sending requests
@@ -175,16 +341,30 @@ class ModbusMqttSource(ModbusDataSource):
             username: Optional username for authentication
             password: Optional password for authentication
             mqtt_client: Optional pre-configured MqttClient instance
+            qos: QoS for request publishes. Defaults to 0: the RTU
+                frames carry their own CRC and a lost message surfaces
+                as a DEFAULT_TIMEOUT expiry, so broker-level
+                acknowledgement round trips add latency without adding
+                integrity
         """
         self.request_topic = request_topic
         self.response_topic = response_topic
-        self._last_response: Optional[bytes] = None
-        
+        self.qos = qos
+        # In-flight requests keyed by expected response frame
+        # signature; each key holds a FIFO of Futures so pipelined
+        # requests sharing a signature resolve in request order
+        self._pending: Dict[tuple, deque] = {}
+        self._pending_lock = threading.Lock()
+        # 外部传入的客户端由调用方负责生命周期管理
+        self._owns_client = mqtt_client is None
+
         if mqtt_client is not None:
             # 如果传入了预先配置的MQTT客户端，直接使用
             self.mqtt = mqtt_client
         else:
             # 否则，创建新的MQTT客户端
+            from .mqtt import MqttClient
+
             self.mqtt = MqttClient(
                 client_id=client_id,
                 host=host,
@@ -206,8 +386,60 @@ class ModbusMqttSource(ModbusDataSource):
             return False
             
     def disconnect(self) -> None:
-        self.mqtt.disconnect()
-        
+        # 共享的客户端可能还在被其他传感器使用，不主动断开
+        if self._owns_client:
+            self.mqtt.disconnect()
+
+    def _register_pending(self, key: tuple) -> Future:
+        """Register an in-flight request and return its Future."""
+        future = Future()
+        with self._pending_lock:
+            self._pending.setdefault(key, deque()).append(future)
+        return future
+
+    def _resolve_pending(self, key: tuple, payload: bytes) -> None:
+        """Resolve the oldest Future waiting on the frame signature."""
+        with self._pending_lock:
+            queue = self._pending.get(key)
+            future = queue.popleft() if queue else None
+            if queue is not None and not queue:
+                del self._pending[key]
+        if future is not None:
+            future.set_result(payload)
+
+    def _discard_pending(self, key: tuple, future: Future) -> None:
+        """Drop a timed-out Future from its pending queue."""
+        with self._pending_lock:
+            queue = self._pending.get(key)
+            if queue is not None:
+                try:
+                    queue.remove(future)
+                except ValueError:
+                    pass
+                if not queue:
+                    del self._pending[key]
+
+    def _wait_response(self, key: tuple, future: Future) -> bytes:
+        """Wait for the response matching an in-flight request.
+
+        Args:
+            key: Frame signature the request was registered under
+            future: Future returned by _register_pending
+
+        Returns:
+            Raw response frame bytes
+
+        Raises:
+            ModbusException: If no matching response arrives in time
+        """
+        try:
+            return future.result(timeout=DEFAULT_TIMEOUT)
+        except FutureTimeoutError:
+            # concurrent.futures.TimeoutError is not an alias of the
+            # builtin before Python 3.11, so catch it by name
+            self._discard_pending(key, future)
+            raise ModbusException("Timeout waiting for MQTT response")
+
     def read_registers(
         self,
         address: int,
@@ -216,51 +448,43 @@ class ModbusMqttSource(ModbusDataSource):
         function_code: int = ModbusFunction.READ_HOLDING_REGISTERS
     ) -> List[int]:
         """Read registers via MQTT."""
+        # Only function 3 frames can be generated for the RTU payload
+        if function_code != _RHR:
+            raise ValueError(f"Unsupported function code: {function_code}")
+
         # Generate Modbus RTU request
         request = ModbusCommand.read_holding_registers(
             address=address,
             count=count,
             slave=unit
         )
-        
-        # Clear previous response
-        self._last_response = None
-        
+
+        # Register before publishing so the response can't slip past;
+        # reads are correlated by (unit, function, byte count)
+        key = (unit, function_code.value, count * 2)
+        future = self._register_pending(key)
+
         # Publish request
         self.mqtt.publish(
             self.request_topic,
             request,  # Send raw bytes
-            qos=DEFAULT_MQTT_QOS
+            qos=self.qos
         )
-        
+
         # Wait for response
-        timeout = DEFAULT_TIMEOUT
-        while timeout > 0 and self._last_response is None:
-            time.sleep(0.1)
-            timeout -= 0.1
-            
-        if self._last_response is None:
-            raise ModbusException("Timeout waiting for MQTT response")
-            
-        response = self._last_response
-        self._last_response = None
-        
+        response = self._wait_response(key, future)
+
         # Parse response
         if not ModbusTools.verify_crc(response):
             raise ModbusException("Invalid CRC in response")
             
-        parsed = ModbusTools.parse_response(response)
-        if parsed["function"] & 0x80:
-            raise ModbusException(f"Modbus error response: {parsed}")
-            
-        # Extract register values
-        values = []
-        data = parsed["data"]
-        for i in range(0, len(data), 2):
-            value = (data[i] << 8) | data[i + 1]
-            values.append(value)
-            
-        return values
+        parsed = ModbusTools.parse_frame(response)
+        if parsed.function & 0x80:
+            raise ModbusException(f"Modbus error response: {response!r}")
+
+        # Extract register values in one C call instead of a per-byte loop
+        data = parsed.data
+        return list(_register_struct(len(data) // 2).unpack_from(data))
         
     def write_register(
         self,
@@ -277,36 +501,138 @@ class ModbusMqttSource(ModbusDataSource):
             slave=unit
         )
         
-        self._last_response = None
-        
+        # Write responses echo the request; correlate by unit and function
+        key = (unit, _WSR.value, None)
+        future = self._register_pending(key)
+
         self.mqtt.publish(
             self.request_topic,
             request,  # Send raw bytes
-            qos=DEFAULT_MQTT_QOS
+            qos=self.qos
         )
-        
-        timeout = DEFAULT_TIMEOUT
-        while timeout > 0 and self._last_response is None:
-            time.sleep(0.1)
-            timeout -= 0.1
-            
-        if self._last_response is None:
-            raise ModbusException("Timeout waiting for MQTT response")
-            
-        response = self._last_response
-        self._last_response = None
-        
+
+        response = self._wait_response(key, future)
+
         # Verify response
         if not ModbusTools.verify_crc(response):
             raise ModbusException("Invalid CRC in response")
             
-        parsed = ModbusTools.parse_response(response)
-        if parsed["function"] & 0x80:
-            raise ModbusException(f"Modbus error response: {parsed}")
-            
+        parsed = ModbusTools.parse_frame(response)
+        if parsed.function & 0x80:
+            raise ModbusException(f"Modbus error response: {response!r}")
+
+    def write_register_async(
+        self,
+        address: int,
+        value: int,
+        unit: int
+    ) -> Future:
+        """Publish a write and return a Future resolved on response.
+
+        Lets callers pipeline N writes for roughly one round trip in
+        total instead of N; the CRC and error-frame checks that the
+        blocking path runs inline happen in the response handler and
+        surface through the Future. The returned Future carries a
+        _discard hook that drops the request from the pending queue,
+        so a caller giving up on it can prevent the next write echo
+        from resolving the stale entry and skewing correlation, the
+        same way _wait_response discards on timeout.
+        """
+        request = ModbusCommand.write_single_register(
+            address=address,
+            value=value,
+            slave=unit
+        )
+
+        key = (unit, _WSR.value, None)
+        raw_future = self._register_pending(key)
+        done = Future()
+        done._discard = lambda: self._discard_pending(key, raw_future)
+
+        def _finish(fut):
+            try:
+                response = fut.result()
+                if not ModbusTools.verify_crc(response):
+                    raise ModbusException("Invalid CRC in response")
+                parsed = ModbusTools.parse_frame(response)
+                if parsed.function & 0x80:
+                    raise ModbusException(f"Modbus error response: {response!r}")
+                done.set_result(None)
+            except Exception as e:
+                done.set_exception(e)
+
+        raw_future.add_done_callback(_finish)
+
+        self.mqtt.publish(
+            self.request_topic,
+            request,  # Send raw bytes
+            qos=self.qos
+        )
+        return done
+
+    def write_registers(
+        self,
+        address: int,
+        values: List[int],
+        unit: int
+    ) -> None:
+        """Write consecutive registers in one function 0x10 transaction."""
+        request = ModbusCommand.write_multiple_registers(
+            address=address,
+            values=values,
+            slave=unit
+        )
+
+        key = (unit, _WMR.value, None)
+        future = self._register_pending(key)
+
+        self.mqtt.publish(
+            self.request_topic,
+            request,  # Send raw bytes
+            qos=self.qos
+        )
+
+        response = self._wait_response(key, future)
+
+        # Verify response
+        if not ModbusTools.verify_crc(response):
+            raise ModbusException("Invalid CRC in response")
+
+        parsed = ModbusTools.parse_frame(response)
+        if parsed.function & 0x80:
+            raise ModbusException(f"Modbus error response: {response!r}")
+
     def _handle_response(self, topic: str, payload: bytes) -> None:
-        """Handle MQTT response messages."""
-        self._last_response = payload
+        """Handle MQTT response messages.
+
+        Responses are matched back to their in-flight request by the
+        (unit, function, byte count) signature of the frame, so several
+        requests — even on a shared client — can be outstanding at once.
+        """
+        if not isinstance(payload, (bytes, bytearray)) or len(payload) < 3:
+            # Not a raw frame; hand it to every waiting request so each
+            # fails fast on CRC instead of running out its timeout
+            with self._pending_lock:
+                futures = [f for q in self._pending.values() for f in q]
+                self._pending.clear()
+            for future in futures:
+                future.set_result(payload)
+            return
+
+        unit, function = payload[0], payload[1]
+        if function & 0x80:
+            # Error response carries no byte count; match on function
+            with self._pending_lock:
+                keys = [
+                    k for k in self._pending
+                    if k[0] == unit and k[1] == function & 0x7F
+                ]
+            for key in keys:
+                self._resolve_pending(key, payload)
+        elif function in _READ_FUNC_VALUES:
+            self._resolve_pending((unit, function, payload[2]), payload)
+        else:
+            self._resolve_pending((unit, function, None), payload)
 
 class ModbusTCPSource(ModbusDataSource):
     """Modbus TCP data source."""
@@ -331,6 +657,8 @@ class ModbusTCPSource(ModbusDataSource):
             self.client = client
         else:
             # 否则，创建新的客户端
+            from pymodbus.client import ModbusTcpClient
+
             self.client = ModbusTcpClient(
                 host=host,
                 port=port,
@@ -352,28 +680,42 @@ class ModbusTCPSource(ModbusDataSource):
     ) -> List[int]:
         """Read registers from TCP device."""
         try:
-            if function_code == ModbusFunction.READ_HOLDING_REGISTERS:
-                response = self.client.read_holding_registers(
-                    address=address,
-                    count=count,
-                    slave=unit
-                )
-            elif function_code == ModbusFunction.READ_INPUT_REGISTERS:
-                response = self.client.read_input_registers(
-                    address=address,
-                    count=count,
-                    slave=unit
-                )
-            else:
+            read = _READ_DISPATCH.get(function_code)
+            if read is None:
                 raise ValueError(f"Unsupported function code: {function_code}")
-                
+            response = read(self.client, address, count, unit)
+
             if response and not response.isError():
                 return response.registers
             raise ModbusException(f"Failed to read register {address}")
         except Exception as e:
             logger.error(f"Error reading register {address}: {e}")
             raise
-            
+
+    def read_many(
+        self,
+        requests: List[Tuple[int, int, int]]
+    ) -> List[List[int]]:
+        """Read several register blocks over the shared connection.
+
+        pymodbus's synchronous transport tags each request with an
+        auto-incremented transaction ID but completes one transaction at
+        a time, so the blocks are issued back-to-back in request order.
+        This degrades gracefully for gateways that drop out-of-order
+        responses while paying the connection checks and adapter
+        overhead once per batch instead of once per block.
+
+        Args:
+            requests: List of (unit, address, count) tuples
+
+        Returns:
+            List of register-value lists, in request order
+        """
+        return [
+            self.read_registers(address, count, unit)
+            for unit, address, count in requests
+        ]
+
     def write_register(
         self,
         address: int,
@@ -383,30 +725,41 @@ class ModbusTCPSource(ModbusDataSource):
     ) -> None:
         """Write register to TCP device."""
         try:
-            if function_code == ModbusFunction.WRITE_SINGLE_REGISTER:
-                response = self.client.write_register(
-                    address=address,
-                    value=value,
-                    slave=unit
-                )
-            elif function_code == ModbusFunction.WRITE_MULTIPLE_REGISTERS:
-                response = self.client.write_registers(
-                    address=address,
-                    values=[value],
-                    slave=unit
-                )
-            else:
+            write = _WRITE_DISPATCH.get(function_code)
+            if write is None:
                 raise ValueError(f"Unsupported function code: {function_code}")
-                
+            response = write(self.client, address, value, unit)
+
             if response and response.isError():
                 raise ModbusException(f"Failed to write register {address}")
         except Exception as e:
             logger.error(f"Error writing register {address}: {e}")
             raise
 
+    def write_registers(
+        self,
+        address: int,
+        values: List[int],
+        unit: int
+    ) -> None:
+        """Write consecutive registers in one function 0x10 transaction."""
+        try:
+            response = self.client.write_registers(
+                address=address,
+                values=list(values),
+                slave=unit
+            )
+            if response and response.isError():
+                raise ModbusException(f"Failed to write registers at {address}")
+        except Exception as e:
+            logger.error(f"Error writing registers at {address}: {e}")
+            raise
+
 class ModbusAdapter:
     """Modbus protocol adapter supporting multiple data sources."""
-    
+
+    __slots__ = ('source', '_group_plans', '_inflight_writes')
+
     def __init__(
         self,
         comm_type: CommType = None,
@@ -435,7 +788,15 @@ class ModbusAdapter:
                 raise ValueError(f"Unsupported communication type: {comm_type}")
         else:
             raise ValueError("Either comm_type or source must be provided")
-            
+
+        # Cached coalescing plans for read_registers_as_dict, keyed by
+        # the identity of the register config dict (a reference to the
+        # dict is kept in the value so the id can't be recycled)
+        self._group_plans: Dict[int, tuple] = {}
+
+        # Outstanding pipelined writes awaiting drain()
+        self._inflight_writes: List[Future] = []
+
     def connect(self) -> bool:
         """Connect to data source."""
         return self.source.connect()
@@ -464,8 +825,114 @@ class ModbusAdapter:
         """Write register."""
         if isinstance(value, float):
             value = int(value)
+        self.write_register_int(register, value, unit, function_code)
+
+    def write_register_int(
+        self,
+        register: int,
+        value: int,
+        unit: Optional[int] = None,
+        function_code: int = ModbusFunction.WRITE_SINGLE_REGISTER
+    ) -> None:
+        """Write register with an integer value.
+
+        Typed variant of write_register: callers that already hold an
+        int skip the per-call isinstance check, which matters in tight
+        control loops.
+
+        Args:
+            register: Register address
+            value: Integer value to write
+            unit: Unit ID (defaults to 1)
+            function_code: Modbus function code
+        """
         self.source.write_register(register, value, unit or 1, function_code)
-        
+
+    def write_register_async(
+        self,
+        register: int,
+        value: Union[int, float],
+        unit: Optional[int] = None
+    ) -> Future:
+        """Write register without waiting for its response.
+
+        Pipelined writes are acknowledged out of band; call drain() at
+        the end of a batch to wait for completion and surface errors.
+
+        Args:
+            register: Register address
+            value: Value to write
+            unit: Unit ID (defaults to 1)
+
+        Returns:
+            Future resolved when the write is acknowledged
+        """
+        if isinstance(value, float):
+            value = int(value)
+        future = self.source.write_register_async(register, value, unit or 1)
+        self._inflight_writes.append(future)
+        return future
+
+    def drain(self, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """Wait for all outstanding pipelined writes to complete.
+
+        Args:
+            timeout: Maximum seconds to wait for the whole batch
+
+        Raises:
+            ModbusException: If any write is still unacknowledged when
+                the timeout expires, or if a write failed
+        """
+        futures, self._inflight_writes = self._inflight_writes, []
+        done, not_done = wait(futures, timeout=timeout)
+        if not_done:
+            # Drop the abandoned requests from the source's pending
+            # queue so later responses can't resolve the stale entries
+            # and shift every subsequent write onto the wrong echo
+            for future in not_done:
+                discard = getattr(future, "_discard", None)
+                if discard is not None:
+                    discard()
+            raise ModbusException(
+                f"{len(not_done)} write(s) not acknowledged in time"
+            )
+        for future in done:
+            future.result()  # Re-raise any write failure
+
+    def read_registers_as_array(
+        self,
+        register: int,
+        count: int,
+        unit: Optional[int] = None,
+        scale: float = 1.0,
+        signed: bool = False
+    ) -> array:
+        """Read a register block into a compact numeric array.
+
+        One coalesced read, then sign fixup and scaling applied across
+        the whole block; the result is an unboxed array.array rather
+        than a list of Python ints, so numeric consumers avoid
+        re-boxing every element downstream.
+
+        Args:
+            register: Starting register address
+            count: Number of registers to read
+            unit: Unit ID (defaults to 1)
+            scale: Scale factor applied to every register
+            signed: Interpret registers as signed 16-bit values
+
+        Returns:
+            array('d') of scaled values when scale != 1.0, otherwise
+            array('h'/'H') of the raw (sign-corrected) values
+        """
+        values = self.read_register(register, count, unit)
+        if signed:
+            # Branchless two's-complement fixup
+            values = [(v ^ 0x8000) - 0x8000 for v in values]
+        if scale != 1.0:
+            return array('d', [v * scale for v in values])
+        return array('h' if signed else 'H', values)
+
     def read_float(
         self,
         register: int,
@@ -474,8 +941,8 @@ class ModbusAdapter:
     ) -> float:
         """Read float value from two consecutive registers."""
         values = self.read_register(register, 2, unit)
-        bytes_val = struct.pack('>HH', values[0], values[1])
-        return struct.unpack(byte_order, bytes_val)[0]
+        bytes_val = _STRUCT_HH.pack(values[0], values[1])
+        return _float_struct(byte_order).unpack(bytes_val)[0]
         
     def write_float(
         self,
@@ -484,11 +951,67 @@ class ModbusAdapter:
         byte_order: str = '>f',
         unit: Optional[int] = None
     ) -> None:
-        """Write float value to two consecutive registers."""
-        bytes_val = struct.pack(byte_order, value)
-        values = struct.unpack('>HH', bytes_val)
-        self.write_register(register, values[0], unit)
-        self.write_register(register + 1, values[1], unit)
+        """Write float value to two consecutive registers.
+
+        Both 16-bit halves go out in a single function 0x10 transaction
+        so the write costs one round trip instead of two.
+        """
+        bytes_val = _float_struct(byte_order).pack(value)
+        values = _STRUCT_HH.unpack(bytes_val)
+        self.source.write_registers(register, list(values), unit or 1)
+
+    def _plan_groups(self, registers: Dict[str, Dict[str, Any]]):
+        """Plan coalesced reads for a register configuration dict.
+
+        Contiguous single-register entries are merged into runs so each
+        run costs one Modbus transaction instead of one per register;
+        multi-register entries (e.g. floats) keep dedicated reads. The
+        plan is computed once per config dict and cached.
+
+        Args:
+            registers: Dictionary of register configurations
+
+        Returns:
+            Tuple of (groups, separate) where groups is a list of
+            (start, total_len, [(name, offset, convert), ...]) runs and
+            separate is a list of (name, config) entries read alone;
+            convert maps a raw register to its signed/scaled value
+        """
+        cached = self._group_plans.get(id(registers))
+        if cached is not None and cached[0] is registers:
+            return cached[1], cached[2]
+
+        singles = []
+        separate = []
+        for name, config in registers.items():
+            if config.get('len', 1) == 1:
+                singles.append((config['reg'], name, config))
+            else:
+                separate.append((name, config))
+        singles.sort(key=lambda entry: entry[0])
+
+        groups = []
+        for reg, name, config in singles:
+            # Bake sign handling and scaling into one converter at plan
+            # time; the signed path uses the branchless two's-complement
+            # identity so the per-value hot loop carries no conditionals
+            scale = config.get('scale', 1)
+            if config.get('signed', False):
+                conv = lambda v, s=scale: ((v ^ 0x8000) - 0x8000) * s
+            else:
+                conv = lambda v, s=scale: v * s
+            # Near-contiguous registers are also merged: reading a few
+            # throwaway filler registers is far cheaper than an extra
+            # round trip, so small gaps extend the current run
+            if groups and 0 <= reg - (groups[-1][0] + groups[-1][1]) <= _COALESCE_GAP:
+                start, length, members = groups[-1]
+                members.append((name, reg - start, conv))
+                groups[-1] = (start, reg - start + 1, members)
+            else:
+                groups.append((reg, 1, [(name, 0, conv)]))
+
+        self._group_plans[id(registers)] = (registers, groups, separate)
+        return groups, separate
 
     def read_registers_as_dict(
         self,
@@ -496,37 +1019,43 @@ class ModbusAdapter:
         unit: Optional[int] = None
     ) -> Dict[str, Any]:
         """Read multiple registers and return as dictionary.
-        
+
+        Adjacent single registers are coalesced into one transaction
+        per contiguous run and sliced out of the returned block.
+
         Args:
             registers: Dictionary of register configurations
             unit: Unit ID (defaults to self.address)
-            
+
         Returns:
             Dictionary of register names and values
         """
         result = {}
-        for name, config in registers.items():
+        groups, separate = self._plan_groups(registers)
+
+        for start, total_len, members in groups:
+            try:
+                values = self.read_register(start, total_len, unit)
+            except Exception as e:
+                logger.error(
+                    f"Error reading registers {start}-{start + total_len - 1}: {e}"
+                )
+                for name, _offset, _conv in members:
+                    result[name] = None
+                continue
+            for name, offset, conv in members:
+                result[name] = conv(values[offset])
+
+        for name, config in separate:
             reg = config['reg']
             length = config.get('len', 1)
-            scale = config.get('scale', 1)
-            signed = config.get('signed', False)
-            
             try:
-                values = self.read_register(reg, length, unit)
-                
-                if length == 1:
-                    value = values[0]
-                    if signed and value > 32767:
-                        value -= 65536
-                    value *= scale
-                elif length == 2 and config.get('type') == 'float':
-                    value = self.read_float(reg, unit=unit)
+                if length == 2 and config.get('type') == 'float':
+                    result[name] = self.read_float(reg, unit=unit)
                 else:
-                    value = values
-                    
-                result[name] = value
+                    result[name] = self.read_register(reg, length, unit)
             except Exception as e:
                 logger.error(f"Error reading register {name}: {e}")
                 result[name] = None
-                
+
         return result 
\ No newline at end of file
@@ -3,9 +3,12 @@ MQTT Client for sensor data publishing and command subscription.
 """
 import json
 import logging
+import socket
 from typing import Any, Callable, Dict, Optional
 
 import paho.mqtt.client as mqtt
+from paho.mqtt.packettypes import PacketTypes
+from paho.mqtt.properties import Properties
 
 from .constants import DEFAULT_MQTT_PORT, DEFAULT_MQTT_QOS
 
@@ -21,10 +24,12 @@ class MqttClient:
         port: int = DEFAULT_MQTT_PORT,
         username: Optional[str] = None,
         password: Optional[str] = None,
-        keepalive: int = 60
+        keepalive: int = 60,
+        clean_session: bool = False,
+        tcp_nodelay: bool = True
     ):
         """Initialize MQTT client.
-        
+
         Args:
             client_id: Client identifier
             host: MQTT broker host
@@ -32,6 +37,14 @@ class MqttClient:
             username: MQTT username
             password: MQTT password
             keepalive: Keepalive timeout in seconds
+            clean_session: Start with a fresh broker session. Defaults
+                to False so the broker keeps subscriptions and in-flight
+                QoS state across reconnects (MQTT v5 clean_start plus a
+                session expiry interval); requires a stable client_id
+            tcp_nodelay: Disable Nagle's algorithm on the broker
+                socket. Publishes here are tiny (Modbus requests are
+                under 30 bytes) and should never wait in the kernel to
+                be coalesced
         """
         self.client = mqtt.Client(
             client_id=client_id,
@@ -48,29 +61,69 @@ class MqttClient:
         self.host = host
         self.port = port
         self.keepalive = keepalive
+        self._clean_session = clean_session
+        self._tcp_nodelay = tcp_nodelay
         self._handlers = {}
-        
+        self._sub_qos = {}
+        self._wildcards = []
+        self._connected = False
+
     def connect(self) -> None:
-        """Connect to MQTT broker."""
+        """Connect to MQTT broker.
+
+        Safe to call multiple times; subsequent calls on an already
+        connected client are no-ops so the client can be shared by
+        several data sources.
+        """
+        if self._connected:
+            return
         try:
+            clean_start = True
+            properties = None
+            if not self._clean_session:
+                # Ask the broker to retain the session for an hour so
+                # reconnects skip the SUBSCRIBE replay
+                clean_start = False
+                properties = Properties(PacketTypes.CONNECT)
+                properties.SessionExpiryInterval = 3600
             self.client.connect(
                 self.host,
                 self.port,
-                self.keepalive
+                self.keepalive,
+                clean_start=clean_start,
+                properties=properties
             )
+            if self._tcp_nodelay:
+                self._set_tcp_nodelay()
             self.client.loop_start()
+            self._connected = True
             logger.info(
                 f"Connected to MQTT broker at {self.host}:{self.port}"
             )
         except Exception as e:
             logger.error(f"Failed to connect to MQTT broker: {e}")
             raise
-            
+
+    def _set_tcp_nodelay(self) -> None:
+        """Disable Nagle's algorithm on the underlying broker socket.
+
+        Nagle can hold a small publish in the kernel for tens of
+        milliseconds waiting to coalesce it with more data. Failures
+        are non-fatal (e.g. websocket transports expose no raw socket).
+        """
+        try:
+            sock = self.client.socket()
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except Exception as e:
+            logger.debug(f"Could not set TCP_NODELAY on MQTT socket: {e}")
+
     def disconnect(self) -> None:
         """Disconnect from MQTT broker."""
         try:
             self.client.loop_stop()
             self.client.disconnect()
+            self._connected = False
             logger.info("Disconnected from MQTT broker")
         except Exception as e:
             logger.error(f"Error disconnecting from MQTT broker: {e}")
@@ -85,15 +138,42 @@ class MqttClient:
         
         Args:
             topic: Topic to publish to
-            payload: Message payload
+            payload: Message payload; pass pre-serialized bytes on hot
+                paths so nothing is re-encoded per call
             qos: Quality of service level
         """
         try:
             self.client.publish(topic, payload, qos)
-            logger.debug(f"Published to {topic}")
+            # Lazy %-formatting: no string is built unless DEBUG is on,
+            # which matters at per-message rates
+            logger.debug("Published to %s", topic)
         except Exception as e:
             logger.error(f"Failed to publish to {topic}: {e}")
             
+    def publish_batch(
+        self,
+        items,
+        qos: int = DEFAULT_MQTT_QOS
+    ) -> None:
+        """Publish several messages in one burst.
+
+        All messages are enqueued back to back so paho's network loop
+        drains them in a single iteration — fewer wakeups and TCP
+        segments than K separate publish() calls, and single messages
+        via publish() are still sent immediately.
+
+        Args:
+            items: Iterable of (topic, payload) pairs
+            qos: Quality of service level applied to every message
+        """
+        publish = self.client.publish
+        try:
+            for topic, payload in items:
+                publish(topic, payload, qos)
+            logger.debug("Published batch of messages")
+        except Exception as e:
+            logger.error(f"Failed to publish batch: {e}")
+
     def subscribe(
         self,
         topic: str,
@@ -101,19 +181,62 @@ class MqttClient:
         qos: int = DEFAULT_MQTT_QOS
     ) -> None:
         """Subscribe to topic.
-        
+
+        Multiple handlers may be registered for the same topic; the
+        broker-side subscription is only made once and each incoming
+        message is delivered to every handler. Topics may contain MQTT
+        wildcards (e.g. "modbus/+/response") so one subscription can
+        cover many unit-specific topics instead of one SUBSCRIBE each.
+
         Args:
             topic: Topic to subscribe to
             handler: Callback function for messages
             qos: Quality of service level
         """
         try:
-            self.client.subscribe(topic, qos)
-            self._handlers[topic] = handler
-            logger.info(f"Subscribed to {topic}")
+            if topic not in self._handlers:
+                self.client.subscribe(topic, qos)
+                self._handlers[topic] = []
+                self._sub_qos[topic] = qos
+                if "+" in topic or "#" in topic:
+                    self._wildcards.append(topic)
+                logger.info(f"Subscribed to {topic}")
+            if handler not in self._handlers[topic]:
+                self._handlers[topic].append(handler)
         except Exception as e:
             logger.error(f"Failed to subscribe to {topic}: {e}")
             
+    def subscribe_many(
+        self,
+        subscriptions: Dict[str, Callable],
+        qos: int = DEFAULT_MQTT_QOS
+    ) -> None:
+        """Subscribe to several topics with one SUBSCRIBE packet.
+
+        K individual subscribe() calls cost K broker round trips at
+        startup; passing the topic list to paho in one call costs one
+        regardless of K.
+
+        Args:
+            subscriptions: Mapping of topic to handler callback
+            qos: Quality of service level applied to every topic
+        """
+        new_topics = [t for t in subscriptions if t not in self._handlers]
+        try:
+            if new_topics:
+                self.client.subscribe([(t, qos) for t in new_topics])
+                for topic in new_topics:
+                    self._handlers[topic] = []
+                    self._sub_qos[topic] = qos
+                    if "+" in topic or "#" in topic:
+                        self._wildcards.append(topic)
+                logger.info(f"Subscribed to {len(new_topics)} topics")
+            for topic, handler in subscriptions.items():
+                if handler not in self._handlers[topic]:
+                    self._handlers[topic].append(handler)
+        except Exception as e:
+            logger.error(f"Failed to subscribe to topics: {e}")
+
     def _on_connect(self, client, userdata, flags, rc, properties=None):
         """Handle connection established.
         
@@ -126,6 +249,17 @@ class MqttClient:
         """
         if rc == 0:
             logger.info("MQTT connection established")
+            # Replay subscriptions only when the broker did not resume
+            # our session; an intact session already has them, and
+            # re-subscribing on every reconnect can stall for seconds
+            # under reconnect storms
+            session_present = bool(
+                flags.get("session present") if isinstance(flags, dict)
+                else getattr(flags, "session_present", False)
+            )
+            if not session_present:
+                for topic, qos in self._sub_qos.items():
+                    self.client.subscribe(topic, qos)
         else:
             logger.error(f"MQTT connection failed with code {rc}")
             
@@ -149,11 +283,19 @@ class MqttClient:
             userdata: User data
             message: Received message
         """
-        try:
-            handler = self._handlers.get(message.topic)
-            if handler:
+        handlers = self._handlers.get(message.topic)
+        if handlers is None:
+            # Fall back to wildcard subscriptions (exact match above
+            # keeps the common case a single dict lookup)
+            for sub in self._wildcards:
+                if mqtt.topic_matches_sub(sub, message.topic):
+                    handlers = self._handlers[sub]
+                    break
+        if not handlers:
+            logger.warning(f"No handler for topic {message.topic}")
+            return
+        for handler in handlers:
+            try:
                 handler(message.topic, message.payload)
-            else:
-                logger.warning(f"No handler for topic {message.topic}")
-        except Exception as e:
-            logger.error(f"Error handling message: {e}") 
\ No newline at end of file
+            except Exception as e:
+                logger.error(f"Error handling message: {e}") 
\ No newline at end of file
@@ -1,10 +1,12 @@
 """
 Air environment sensor implementation.
 """
+from types import MappingProxyType
 from typing import Any, Dict, List
 
-from ..core.constants import (AirRegister, CommType, ModbusBaudRate, ModbusDataType,
-                          ModbusFunction, RegisterType, ScaleFactor, Unit)
+from ..core.constants import (AIR_BASIC, AirRegister, CommType, ModbusBaudRate,
+                          ModbusDataType, ModbusFunction, RegisterType,
+                          ScaleFactor, Unit)
 from ..core.modbus import ModbusAdapter
 from ..core.sensor import BaseSensor
 
@@ -55,6 +57,19 @@ AIR_SENSOR_CONFIG = {
     }
 }
 
+# Freeze the shared config down to the per-entry dicts: sensors use it
+# directly with no per-instance copies, and the read-only views make
+# accidental mutation of the shared state impossible
+AIR_SENSOR_CONFIG["registers"] = MappingProxyType({
+    name: MappingProxyType(cfg)
+    for name, cfg in AIR_SENSOR_CONFIG["registers"].items()
+})
+AIR_SENSOR_CONFIG["composite"] = MappingProxyType({
+    name: MappingProxyType(cfg)
+    for name, cfg in AIR_SENSOR_CONFIG["composite"].items()
+})
+AIR_SENSOR_CONFIG = MappingProxyType(AIR_SENSOR_CONFIG)
+
 class AirSensor(BaseSensor):
     """Air environment sensor implementation."""
     
@@ -77,11 +92,8 @@ class AirSensor(BaseSensor):
             **kwargs
         )
         
-        # Create sensor config
-        config = AIR_SENSOR_CONFIG.copy()
-        
-        # Initialize base sensor with unit ID
-        super().__init__(config, modbus, unit_id)
+        # Initialize base sensor with the shared read-only config
+        super().__init__(AIR_SENSOR_CONFIG, modbus, unit_id)
         
     def get_humidity(self) -> float:
         """Get air humidity value.
@@ -211,21 +223,14 @@ class AirSensor(BaseSensor):
         Returns:
             Processed values
         """
-        humidity = values[0] * ScaleFactor.HUMIDITY
-        
-        temp = values[1]
-        if temp > 32767:  # Handle signed value
-            temp -= 65536
-        temp *= ScaleFactor.TEMPERATURE
-        
-        co2 = values[2] * ScaleFactor.CO2
-        
+        result = {}
+        for (name, _addr, scale, signed), raw in zip(AIR_BASIC, values):
+            if signed:
+                # Branchless two's-complement sign extension
+                raw = (raw ^ 0x8000) - 0x8000
+            result[name] = raw * scale
+
         # Combine high and low light values
-        light = (values[3] << 16) | values[4]
-        
-        return {
-            "humidity": humidity,
-            "temperature": temp,
-            "co2": co2,
-            "light": light
-        } 
\ No newline at end of file
+        result["light"] = (values[3] << 16) | values[4]
+
+        return result 
\ No newline at end of file
@@ -1,11 +1,12 @@
 """
 Soil sensor implementation.
 """
+from types import MappingProxyType
 from typing import Any, Dict, List
 
-from ..core.constants import (CommType, ModbusBaudRate, ModbusDataType,
-                            ModbusFunction, RegisterType, ScaleFactor,
-                            SoilRegister, Unit)
+from ..core.constants import (SOIL_BASIC, CommType, ModbusBaudRate,
+                            ModbusDataType, ModbusFunction, RegisterType,
+                            ScaleFactor, SoilRegister, Unit)
 from ..core.modbus import ModbusAdapter
 from ..core.sensor import BaseSensor
 
@@ -79,10 +80,38 @@ SOIL_SENSOR_CONFIG = {
             ],
             "len": 3,
             "parse": "custom_soil_npk"
+        },
+        # Basic parameters and NPK occupy contiguous registers, so both
+        # groups can be fetched in a single read
+        "all_npk": {
+            "regs": [
+                SoilRegister.MOISTURE,
+                SoilRegister.TEMPERATURE,
+                SoilRegister.EC,
+                SoilRegister.PH,
+                SoilRegister.NITROGEN,
+                SoilRegister.PHOSPHORUS,
+                SoilRegister.POTASSIUM
+            ],
+            "len": 7,
+            "parse": "custom_soil_all_npk"
         }
     }
 }
 
+# Freeze the shared config down to the per-entry dicts: sensors use it
+# directly with no per-instance copies, and the read-only views make
+# accidental mutation of the shared state impossible
+SOIL_SENSOR_CONFIG["registers"] = MappingProxyType({
+    name: MappingProxyType(cfg)
+    for name, cfg in SOIL_SENSOR_CONFIG["registers"].items()
+})
+SOIL_SENSOR_CONFIG["composite"] = MappingProxyType({
+    name: MappingProxyType(cfg)
+    for name, cfg in SOIL_SENSOR_CONFIG["composite"].items()
+})
+SOIL_SENSOR_CONFIG = MappingProxyType(SOIL_SENSOR_CONFIG)
+
 class SoilSensor(BaseSensor):
     """Soil sensor implementation."""
     
@@ -100,18 +129,37 @@ class SoilSensor(BaseSensor):
             **kwargs: Additional arguments for ModbusAdapter
         """
         # Create ModbusAdapter instance
-        modbus_kwargs = kwargs.copy()  # Make a copy to avoid modifying the original
         modbus = ModbusAdapter(
             comm_type=modbus_type,
-            **modbus_kwargs
+            **kwargs
         )
         
-        # Create sensor config
-        config = SOIL_SENSOR_CONFIG.copy()
-        
-        # Initialize base sensor with unit ID
-        super().__init__(config, modbus, unit_id)
-        
+        # Initialize base sensor with the shared read-only config
+        super().__init__(SOIL_SENSOR_CONFIG, modbus, unit_id)
+
+        # ScaleFactor.NPK is the identity today; when it is, route the
+        # npk composite through a no-multiply parser so each poll skips
+        # three wasted float multiplications
+        if ScaleFactor.NPK == 1:
+            self._composite_parsers["npk"] = self._npk_identity
+
+    @staticmethod
+    def _npk_identity(values: List[int]) -> Dict[str, int]:
+        """custom_soil_npk fast path for an identity NPK scale.
+
+        Args:
+            values: Raw register values
+
+        Returns:
+            Raw values keyed by nutrient name
+        """
+        return {
+            "nitrogen": values[0],
+            "phosphorus": values[1],
+            "potassium": values[2]
+        }
+
+
     def get_moisture(self) -> float:
         """Get soil moisture value.
         
@@ -154,11 +202,19 @@ class SoilSensor(BaseSensor):
         
     def get_npk(self) -> Dict[str, float]:
         """Get NPK (Nitrogen, Phosphorus, Potassium) values.
-        
+
         Returns:
             Dictionary with N, P, K values
         """
         return self.read_composite("npk")
+
+    def get_all_and_npk(self) -> Dict[str, float]:
+        """Get basic parameters and NPK values in one Modbus read.
+
+        Returns:
+            Dictionary with moisture, temperature, EC, pH and N/P/K values
+        """
+        return self.read_composite("all_npk")
         
     def calibrate_temperature(self, value: float) -> None:
         """Calibrate temperature reading.
@@ -225,33 +281,47 @@ class SoilSensor(BaseSensor):
         
     def custom_soil_all(self, values: List[int]) -> Dict[str, float]:
         """Custom parser for all soil parameters.
-        
+
+        Zips the raw block with the frozen SOIL_BASIC metadata table
+        (the first four entries cover moisture/temperature/ec/ph), so
+        parsing is one pass over parallel tuples instead of per-field
+        dict lookups.
+
         Args:
             values: Raw register values
-            
+
         Returns:
             Processed values
         """
-        moisture = values[0]
-        if moisture > 32767:  # Handle signed value
-            moisture -= 65536
-        moisture *= ScaleFactor.MOISTURE
-        
-        temp = values[1]
-        if temp > 32767:  # Handle signed value
-            temp -= 65536
-        temp *= ScaleFactor.TEMPERATURE
-        
-        ec = values[2] * ScaleFactor.EC
-        ph = values[3] * ScaleFactor.PH
-        
-        return {
-            "moisture": moisture,
-            "temperature": temp,
-            "ec": ec,
-            "ph": ph
-        }
-        
+        result = {}
+        for (name, _addr, scale, signed), raw in zip(SOIL_BASIC, values):
+            if signed:
+                # Branchless two's-complement sign extension
+                raw = (raw ^ 0x8000) - 0x8000
+            result[name] = raw * scale
+        return result
+        
+    def custom_soil_all_npk(self, values: List[int]) -> Dict[str, float]:
+        """Custom parser for the combined basic + NPK read.
+
+        The raw block is zipped with the frozen SOIL_BASIC metadata
+        table in one pass instead of going through the two per-group
+        parsers.
+
+        Args:
+            values: Raw register values
+
+        Returns:
+            Processed values
+        """
+        result = {}
+        for (name, _addr, scale, signed), raw in zip(SOIL_BASIC, values):
+            if signed:
+                # Branchless two's-complement sign extension
+                raw = (raw ^ 0x8000) - 0x8000
+            result[name] = raw * scale
+        return result
+
     def custom_soil_npk(self, values: List[int]) -> Dict[str, float]:
         """Custom parser for NPK values.
         
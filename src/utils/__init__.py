@@ -3,8 +3,11 @@ Utility functions and classes.
 """
 
 from .modbus_tools import ModbusCommand, ModbusTools
+from .timing import run_periodic, run_periodic_async
 
 __all__ = [
     'ModbusCommand',
-    'ModbusTools'
+    'ModbusTools',
+    'run_periodic',
+    'run_periodic_async'
 ] 
\ No newline at end of file
@@ -4,6 +4,9 @@ Utility functions for Modbus debugging and data analysis.
 import binascii
 import struct
 import logging
+from array import array
+from collections import namedtuple
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Union
 
 from ..core.constants import (ModbusDataType, ModbusFunction, RegisterType,
@@ -11,82 +14,162 @@ from ..core.constants import (ModbusDataType, ModbusFunction, RegisterType,
 
 logger = logging.getLogger(__name__)
 
+# Precompiled frame headers: slave, function, then two big-endian
+# 16-bit fields (address + count/value); write-multiple adds the
+# register count and payload byte count
+_HEADER_BBHH = struct.Struct(">BBHH")
+_HEADER_WRITE_MULTI = struct.Struct(">BBHHB")
+
 class ModbusCommand:
     """Modbus command generator."""
-    
+
     @staticmethod
+    @lru_cache(maxsize=256)
     def read_holding_registers(
         address: int,
         count: int = 1,
         slave: int = 1
     ) -> bytes:
         """Generate read holding registers command.
-        
+
+        Polling loops request the same (address, count, slave) tuple
+        every cycle, so the finished frame — CRC included — is memoized
+        and reused instead of being rebuilt per call.
+
         Args:
             address: Starting register address
             count: Number of registers to read
             slave: Slave address
-            
+
         Returns:
             Command bytes
         """
-        cmd = bytes([
-            slave,  # Slave address
-            ModbusFunction.READ_HOLDING_REGISTERS.value,  # Function code
-            (address >> 8) & 0xFF,  # Register address high byte
-            address & 0xFF,         # Register address low byte
-            (count >> 8) & 0xFF,    # Register count high byte
-            count & 0xFF            # Register count low byte
-        ])
+        # One struct.pack call emits the big-endian header directly;
+        # no per-byte shifting or list walking
+        cmd = _HEADER_BBHH.pack(
+            slave,
+            ModbusFunction.READ_HOLDING_REGISTERS.value,
+            address,
+            count
+        )
         return cmd + ModbusTools.calculate_crc(cmd)
-        
+
+
     @staticmethod
+    @lru_cache(maxsize=256)
     def write_single_register(
         address: int,
         value: int,
         slave: int = 1
     ) -> bytes:
         """Generate write single register command.
-        
+
+        Memoized like read_holding_registers: repeated writes of the
+        same value (calibration constants, setpoints) reuse the
+        finished CRC'd frame.
+
         Args:
             address: Register address
             value: Value to write
             slave: Slave address
-            
+
+        Returns:
+            Command bytes
+        """
+        cmd = _HEADER_BBHH.pack(
+            slave,
+            ModbusFunction.WRITE_SINGLE_REGISTER.value,
+            address,
+            value
+        )
+        return cmd + ModbusTools.calculate_crc(cmd)
+
+    @staticmethod
+    def expected_response_size(function_code: int, count: int = 1) -> int:
+        """Expected RTU response frame size for a request.
+
+        Lets transports read exactly the right number of bytes instead
+        of polling byte-wise or waiting out a timeout: read responses
+        are slave + function + byte count + 2*count data + 2 CRC;
+        write responses echo a fixed 8-byte frame.
+
+        Args:
+            function_code: Modbus function code of the request
+            count: Number of registers requested (read functions)
+
+        Returns:
+            Frame size in bytes
+        """
+        if function_code in (ModbusFunction.READ_HOLDING_REGISTERS,
+                             ModbusFunction.READ_INPUT_REGISTERS):
+            return 5 + 2 * count
+        return 8
+
+    @staticmethod
+    def write_multiple_registers(
+        address: int,
+        values: List[int],
+        slave: int = 1
+    ) -> bytes:
+        """Generate write multiple registers (function 0x10) command.
+
+        Args:
+            address: Starting register address
+            values: Register values to write
+            slave: Slave address
+
         Returns:
             Command bytes
         """
-        cmd = bytes([
-            slave,  # Slave address
-            ModbusFunction.WRITE_SINGLE_REGISTER.value,  # Function code
-            (address >> 8) & 0xFF,  # Register address high byte
-            address & 0xFF,         # Register address low byte
-            (value >> 8) & 0xFF,    # Value high byte
-            value & 0xFF            # Value low byte
-        ])
+        count = len(values)
+        cmd = _HEADER_WRITE_MULTI.pack(
+            slave,
+            ModbusFunction.WRITE_MULTIPLE_REGISTERS.value,
+            address,
+            count,
+            count * 2
+        ) + struct.pack(f">{count}H", *values)
         return cmd + ModbusTools.calculate_crc(cmd)
 
+def _build_crc_table() -> array:
+    """Build the 256-entry CRC16-Modbus lookup table (poly 0xA001)."""
+    table = array('H')
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 0x0001:
+                crc = (crc >> 1) ^ 0xA001
+            else:
+                crc >>= 1
+        table.append(crc)
+    return table
+
+# Built once at import: one table lookup per byte replaces the eight
+# shift/XOR iterations of the bit-by-bit loop
+_CRC_TABLE = _build_crc_table()
+
+# Lightweight response view for hot polling paths: one tuple allocation
+# and a zero-copy data slice, versus the dict + bytes copies built by
+# parse_response
+ModbusResponse = namedtuple("ModbusResponse", "slave function data")
+
 class ModbusTools:
     """Modbus protocol utilities."""
-    
+
     @staticmethod
     def calculate_crc(data: bytes) -> bytes:
         """Calculate Modbus CRC16.
-        
+
         Args:
             data: Data bytes
-            
+
         Returns:
             CRC bytes (low byte, high byte)
         """
         crc = 0xFFFF
+        table = _CRC_TABLE
         for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x0001:
-                    crc = (crc >> 1) ^ 0xA001
-                else:
-                    crc >>= 1
+            crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
         return bytes([crc & 0xFF, (crc >> 8) & 0xFF])
         
     @staticmethod
@@ -101,10 +184,43 @@ class ModbusTools:
         """
         if len(data) < 3:
             return False
-        received_crc = data[-2:]
-        calculated_crc = ModbusTools.calculate_crc(data[:-2])
-        return received_crc == calculated_crc
+        # Folding the trailing CRC bytes through the checksum leaves a
+        # zero residue for a valid frame, so the frame is verified in
+        # one pass with no slice or comparison-bytes allocations
+        crc = 0xFFFF
+        table = _CRC_TABLE
+        for byte in data:
+            crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+        return crc == 0
         
+    @staticmethod
+    def parse_frame(data: bytes) -> ModbusResponse:
+        """Parse a Modbus response into a ModbusResponse view.
+
+        Fast-path counterpart to parse_response: the header is decoded
+        with one struct call and the data field is a memoryview over
+        the original buffer, so per-response cost is a single tuple
+        allocation. Use parse_response when the richer diagnostic
+        dictionary is needed.
+
+        Args:
+            data: Response bytes
+
+        Returns:
+            ModbusResponse with slave, function and data (memoryview)
+        """
+        if len(data) < 3:
+            raise ValueError("Response too short")
+
+        slave, function = struct.unpack_from(">BB", data, 0)
+        view = memoryview(data)
+        if function in (ModbusFunction.READ_HOLDING_REGISTERS.value,
+                        ModbusFunction.READ_INPUT_REGISTERS.value):
+            payload = view[3:3 + data[2]]
+        else:
+            payload = view[2:-2]
+        return ModbusResponse(slave, function, payload)
+
     @staticmethod
     def parse_response(data: bytes) -> Dict:
         """Parse Modbus response.
@@ -117,26 +233,31 @@ class ModbusTools:
             - slave_id: Slave ID
             - function: Function code
             - byte_count: Number of data bytes (for read functions)
-            - data: Data bytes
-            - crc: CRC bytes
+            - data: Data bytes (zero-copy memoryview over the input)
+            - crc: CRC bytes (zero-copy memoryview over the input)
         """
         if len(data) < 3:
             raise ValueError("Response too short")
-            
+
         # Skip CRC check for now
         # if not ModbusTools.verify_crc(data):
         #     raise ValueError("Invalid CRC")
-        
+
+        # One memoryview serves every field: the data/crc slices are
+        # zero-copy views over the original buffer instead of fresh
+        # bytes allocations per field
+        view = memoryview(data)
+
         # For read functions (0x03, 0x04), byte 3 is the byte count
-        if data[1] in [ModbusFunction.READ_HOLDING_REGISTERS.value, 
+        if data[1] in [ModbusFunction.READ_HOLDING_REGISTERS.value,
                       ModbusFunction.READ_INPUT_REGISTERS.value]:
             byte_count = data[2]
             return {
                 "slave_id": data[0],
                 "function": data[1],
                 "byte_count": byte_count,
-                "data": data[3:3+byte_count],  # Use byte_count to extract data
-                "crc": data[-2:]
+                "data": view[3:3+byte_count],  # Use byte_count to extract data
+                "crc": view[-2:]
             }
         # For write functions (0x06), data is 2 bytes (address) + 2 bytes (value)
         elif data[1] == ModbusFunction.WRITE_SINGLE_REGISTER.value:
@@ -145,15 +266,15 @@ class ModbusTools:
                 "function": data[1],
                 "register_address": (data[2] << 8) | data[3],
                 "register_value": (data[4] << 8) | data[5],
-                "crc": data[-2:]
+                "crc": view[-2:]
             }
         # For other functions or error responses
         else:
             return {
                 "slave_id": data[0],
                 "function": data[1],
-                "data": data[2:-2],
-                "crc": data[-2:]
+                "data": view[2:-2],
+                "crc": view[-2:]
             }
         
     @staticmethod
@@ -166,7 +287,12 @@ class ModbusTools:
         Returns:
             Formatted hex string
         """
-        return " ".join(f"{b:02X}" for b in data)
+        # bytes.hex with a separator runs in C; one call replaces a
+        # per-byte f-string generator. The bytes() step covers
+        # memoryview slices from parse_response
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+        return data.hex(sep=" ", bytes_per_sep=1).upper()
         
     @staticmethod
     def parse_register_value(
@@ -187,8 +313,9 @@ class ModbusTools:
             Parsed value
         """
         if data_type == ModbusDataType.INT16:
-            if signed and value > 32767:
-                value -= 65536
+            if signed:
+                # Branchless two's-complement sign extension
+                value = (value ^ 0x8000) - 0x8000
             return value * scale
         elif data_type == ModbusDataType.UINT16:
             return value * scale
@@ -197,20 +324,42 @@ class ModbusTools:
 
 class SoilSensorTools:
     """Soil sensor specific tools."""
-    
-    # Common command templates
-    READ_ALL = ModbusCommand.read_holding_registers(
-        SoilRegister.MOISTURE,  # Start from moisture
-        4,                      # Read 4 registers (moisture, temp, ec, ph)
-        1                       # Default slave ID
-    )
-    
-    READ_NPK = ModbusCommand.read_holding_registers(
-        SoilRegister.NITROGEN,  # Start from nitrogen
-        3,                      # Read 3 registers (N, P, K)
-        1                       # Default slave ID
-    )
-    
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def read_all_frame(slave: int = 1) -> bytes:
+        """Read-all-parameters frame for a slave, built once per slave.
+
+        Args:
+            slave: Slave address
+
+        Returns:
+            Command bytes
+        """
+        return ModbusCommand.read_holding_registers(
+            SoilRegister.MOISTURE,  # Start from moisture
+            4,                      # Read 4 registers (moisture, temp, ec, ph)
+            slave
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def read_npk_frame(slave: int = 1) -> bytes:
+        """Read-NPK frame for a slave, built once per slave.
+
+        Args:
+            slave: Slave address
+
+        Returns:
+            Command bytes
+        """
+        return ModbusCommand.read_holding_registers(
+            SoilRegister.NITROGEN,  # Start from nitrogen
+            3,                      # Read 3 registers (N, P, K)
+            slave
+        )
+
+
     @staticmethod
     def parse_raw_data(
         data: Union[bytes, str],
@@ -226,17 +375,17 @@ class SoilSensorTools:
             Parsed data
         """
         if isinstance(data, str):
-            # Convert hex string to bytes
-            data = bytes.fromhex(data.replace(" ", ""))
+            # bytes.fromhex skips spaces itself, so no pre-pass needed
+            data = bytes.fromhex(data)
             
         response = ModbusTools.parse_response(data)
-        values = []
-        
-        # Extract register values
-        for i in range(0, len(response["data"]), 2):
-            value = (response["data"][i] << 8) | response["data"][i + 1]
-            values.append(value)
-            
+
+        # Extract register values in one C-level unpack instead of a
+        # per-byte shift/OR loop
+        payload = response["data"]
+        values = list(struct.unpack(f">{len(payload) // 2}H", payload))
+
+
         # Parse based on register type
         if register_type == "all":
             return {
@@ -269,9 +418,15 @@ class SoilSensorTools:
             (command bytes, description)
         """
         if command_type == "read_all":
-            return (SoilSensorTools.READ_ALL, "Read all parameters")
+            return (
+                SoilSensorTools.read_all_frame(kwargs.get("slave", 1)),
+                "Read all parameters"
+            )
         elif command_type == "read_npk":
-            return (SoilSensorTools.READ_NPK, "Read NPK values")
+            return (
+                SoilSensorTools.read_npk_frame(kwargs.get("slave", 1)),
+                "Read NPK values"
+            )
         elif command_type == "calibrate_ph":
             value = int(float(kwargs["value"]) * 10)
             cmd = ModbusCommand.write_single_register(
@@ -284,32 +439,42 @@ class SoilSensorTools:
             raise ValueError(f"Unknown command type: {command_type}")
             
     @staticmethod
-    def analyze_response(command: bytes, response: bytes) -> Dict:
+    def analyze_response(
+        command: bytes,
+        response: bytes,
+        *,
+        verify: bool = True
+    ) -> Dict:
         """Analyze command-response pair.
-        
+
         Args:
             command: Command bytes
             response: Response bytes
-            
+            verify: Run CRC checks on both frames. Callers that just
+                built the command or already validated the response can
+                pass False to skip the two CRC passes; crc_valid is
+                then reported as None (not checked) rather than a
+                fabricated True
+
         Returns:
             Analysis results
         """
         cmd_parsed = ModbusTools.parse_response(command)
         resp_parsed = ModbusTools.parse_response(response)
-        
+
         return {
             "command": {
                 "raw": ModbusTools.format_bytes(command),
                 "slave_id": cmd_parsed["slave_id"],
                 "function": cmd_parsed["function"],
                 "data": ModbusTools.format_bytes(cmd_parsed["data"]),
-                "crc_valid": ModbusTools.verify_crc(command)
+                "crc_valid": ModbusTools.verify_crc(command) if verify else None
             },
             "response": {
                 "raw": ModbusTools.format_bytes(response),
                 "slave_id": resp_parsed["slave_id"],
                 "function": resp_parsed["function"],
                 "data": ModbusTools.format_bytes(resp_parsed["data"]),
-                "crc_valid": ModbusTools.verify_crc(response)
+                "crc_valid": ModbusTools.verify_crc(response) if verify else None
             }
         } 
\ No newline at end of file
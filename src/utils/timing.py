@@ -0,0 +1,45 @@
+"""
+Timing helpers for periodic sensor polling.
+"""
+import asyncio
+import time
+from typing import Any, Callable
+
+def run_periodic(interval: float, fn: Callable[[], Any]) -> None:
+    """Run a function periodically on a fixed cadence.
+
+    Uses a monotonic deadline so the loop sleeps exactly until the next
+    scheduled run instead of waking every second to compare wall-clock
+    times, and the cadence is immune to NTP clock jumps. If a run
+    overshoots its slot the next one fires immediately.
+
+    Args:
+        interval: Seconds between runs
+        fn: Function to call on each cycle
+    """
+    deadline = time.monotonic()
+    while True:
+        fn()
+        deadline += interval
+        time.sleep(max(0.0, deadline - time.monotonic()))
+
+async def run_periodic_async(interval: float, fn: Callable[[], Any]) -> None:
+    """Asyncio counterpart of run_periodic.
+
+    Schedules against the event loop clock and runs blocking callables
+    in the default executor, so a slow sensor read never stalls other
+    tasks sharing the loop.
+
+    Args:
+        interval: Seconds between runs
+        fn: Function or coroutine function to call on each cycle
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
+    while True:
+        if asyncio.iscoroutinefunction(fn):
+            await fn()
+        else:
+            await loop.run_in_executor(None, fn)
+        deadline += interval
+        await asyncio.sleep(max(0.0, deadline - loop.time()))
@@ -6,67 +6,96 @@ from unittest.mock import MagicMock, patch
 
 from src.core.constants import CommType, ModbusBaudRate, ModbusFunction
 from src.core.modbus import ModbusAdapter, ModbusMqttSource, ModbusSerialSource
+from src.utils.modbus_tools import ModbusCommand, ModbusTools
 
 class TestModbusSerialSource(unittest.TestCase):
     """Test ModbusSerialSource class."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared source once; tests swap in fresh mock clients."""
+        cls.port = "/dev/ttyUSB0"
+        cls.baudrate = ModbusBaudRate.BAUD_4800
+        cls.source = ModbusSerialSource(cls.port, cls.baudrate)
+        # One class-level patcher instead of a decorator per test: the
+        # patch machinery runs once, not once per case
+        patcher = patch('pymodbus.client.ModbusSerialClient')
+        cls.mock_client = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.port = "/dev/ttyUSB0"
-        self.baudrate = ModbusBaudRate.BAUD_4800
-        self.source = ModbusSerialSource(self.port, self.baudrate)
-        
-    @patch('pymodbus.client.ModbusSerialClient')
-    def test_connect(self, mock_client):
+        """Reset the shared client mock between tests."""
+        self.mock_client.reset_mock(return_value=True, side_effect=True)
+        self.source.client = self.mock_client.return_value
+
+    def test_connect(self):
         """Test connection establishment."""
         # Setup mock
-        mock_client.return_value.connect.return_value = True
-        self.source.client = mock_client.return_value
-        
+        self.mock_client.return_value.connect.return_value = True
+
         # Test
         result = self.source.connect()
         self.assertTrue(result)
-        mock_client.return_value.connect.assert_called_once()
-        
-    @patch('pymodbus.client.ModbusSerialClient')
-    def test_read_registers(self, mock_client):
+        self.mock_client.return_value.connect.assert_called_once()
+
+    def test_read_registers(self):
         """Test reading registers."""
         # Setup mock
         mock_response = MagicMock()
         mock_response.registers = [1234, 5678]
         mock_response.isError.return_value = False
-        mock_client.return_value.read_holding_registers.return_value = mock_response
-        self.source.client = mock_client.return_value
-        
+        self.mock_client.return_value.read_holding_registers.return_value = mock_response
+
         # Test
         result = self.source.read_registers(0x0000, 2, 1)
         self.assertEqual(result, [1234, 5678])
-        mock_client.return_value.read_holding_registers.assert_called_with(
+        self.mock_client.return_value.read_holding_registers.assert_called_with(
             address=0x0000,
             count=2,
             slave=1
         )
-        
-    @patch('pymodbus.client.ModbusSerialClient')
-    def test_write_register(self, mock_client):
+
+    def test_write_register(self):
         """Test writing register."""
         # Setup mock
         mock_response = MagicMock()
         mock_response.isError.return_value = False
-        mock_client.return_value.write_register.return_value = mock_response
-        self.source.client = mock_client.return_value
-        
+        self.mock_client.return_value.write_register.return_value = mock_response
+
         # Test
         self.source.write_register(0x0000, 1234, 1)
-        mock_client.return_value.write_register.assert_called_with(
+        self.mock_client.return_value.write_register.assert_called_with(
             address=0x0000,
             value=1234,
             slave=1
         )
 
+class _FakeMqtt:
+    """Minimal MQTT client stand-in.
+
+    Records publishes and hands a canned response straight to the
+    registered handler, avoiding the attribute-machinery overhead of a
+    MagicMock with a side_effect closure on the hot publish path.
+    """
+
+    def __init__(self, handler, response):
+        self.published = []
+        self._handler = handler
+        self._response = response
+
+    def connect(self):
+        pass
+
+    def subscribe(self, topic, handler):
+        pass
+
+    def publish(self, topic, payload, qos=0):
+        self.published.append((topic, payload, qos))
+        self._handler("test/response", self._response)
+
 class TestModbusMqttSource(unittest.TestCase):
     """Test ModbusMqttSource class."""
-    
+
     def setUp(self):
         """Set up test fixtures."""
         self.source = ModbusMqttSource(
@@ -92,30 +121,27 @@ class TestModbusMqttSource(unittest.TestCase):
         
     def test_read_registers(self):
         """Test reading registers via MQTT."""
-        # Setup expected request/response
-        expected_request = {
-            "unit": 1,
-            "function": ModbusFunction.READ_HOLDING_REGISTERS,
-            "address": 0x0000,
-            "count": 2
-        }
-        expected_response = {
-            "registers": [1234, 5678]
-        }
-        
-        # Mock MQTT publish and response
-        def mock_publish(topic, payload, qos):
-            self.source._handle_response("test/response", expected_response)
-            
-        self.source.mqtt.publish.side_effect = mock_publish
-        
+        # The source speaks raw RTU frames over MQTT: the published
+        # request is a function-3 command and the response is a valid
+        # frame carrying registers 1234 and 100
+        expected_request = ModbusCommand.read_holding_registers(
+            address=0x0000,
+            count=2,
+            slave=1
+        )
+        response_body = b"\x01\x03\x04\x04\xD2\x00\x64"
+        response_frame = response_body + ModbusTools.calculate_crc(response_body)
+
+        # Fake MQTT client that echoes the canned response on publish
+        fake = _FakeMqtt(self.source._handle_response, response_frame)
+        self.source.mqtt = fake
+
         # Test
         result = self.source.read_registers(0x0000, 2, 1)
-        self.assertEqual(result, [1234, 5678])
-        self.source.mqtt.publish.assert_called_with(
-            "test/request",
-            expected_request,
-            qos=0
+        self.assertEqual(result, [1234, 100])
+        self.assertEqual(
+            fake.published,
+            [("test/request", expected_request, 0)]
         )
 
 class TestModbusAdapter(unittest.TestCase):
@@ -8,19 +8,46 @@ from src.core.constants import (CommType, ModbusBaudRate, ModbusDataType,
                               ModbusFunction, SoilRegister)
 from src.plugins.soil import SOIL_SENSOR_CONFIG, SoilSensor
 
+class _ModbusRecorder:
+    """Hand-rolled modbus double: records calls in plain lists.
+
+    Avoids MagicMock's attribute-autocreation overhead; the tests only
+    need the recorded (register, value) tuples.
+    """
+
+    def __init__(self):
+        self.writes = []
+        self.reads = []
+        self.read_values = None
+
+    def write_register(self, register, value):
+        self.writes.append((register, value))
+
+    def read_register(self, register, count, unit):
+        self.reads.append((register, count, unit))
+        if self.read_values is not None:
+            return self.read_values
+        return [0] * count
+
 class TestSoilSensor(unittest.TestCase):
     """Test SoilSensor class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create sensor with mocked modbus
-        self.sensor = SoilSensor(
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the sensor once for the class."""
+        cls.sensor = SoilSensor(
             modbus_type=CommType.SERIAL,
             port="/dev/ttyUSB0",
             baudrate=ModbusBaudRate.BAUD_4800
         )
-        self.sensor.modbus = MagicMock()
-        
+
+    def setUp(self):
+        """Give each test a fresh modbus recorder."""
+        self.sensor.modbus = _ModbusRecorder()
+        # Drop per-test method overrides left on the shared instance
+        for name in ("read_register", "read_multiple", "read_composite"):
+            self.sensor.__dict__.pop(name, None)
+
     def test_config_validation(self):
         """Test sensor configuration."""
         # Test default config
@@ -37,7 +64,8 @@ class TestSoilSensor(unittest.TestCase):
         
         # Test
         result = self.sensor.get_moisture()
-        self.assertAlmostEqual(result, 65.8, places=1)
+        # Scale is exactly /10, so compare in the integer domain
+        self.assertEqual(round(result * 10), 658)
         self.sensor.read_register.assert_called_with("moisture")
         
     def test_get_temperature(self):
@@ -47,7 +75,8 @@ class TestSoilSensor(unittest.TestCase):
         
         # Test
         result = self.sensor.get_temperature()
-        self.assertAlmostEqual(result, -10.1, places=1)
+        # Scale is exactly /10, so compare in the integer domain
+        self.assertEqual(round(result * 10), -101)
         self.sensor.read_register.assert_called_with("temperature")
         
     def test_get_all(self):
@@ -83,45 +112,47 @@ class TestSoilSensor(unittest.TestCase):
             ["nitrogen", "phosphorus", "potassium"]
         )
         
-    def test_calibrate_temperature(self):
-        """Test temperature calibration."""
-        self.sensor.calibrate_temperature(25.5)
-        self.sensor.modbus.write_register.assert_called_once_with(
-            SoilRegister.TEMP_CAL,
-            255  # 25.5 * 10
-        )
-        
-    def test_calibrate_moisture(self):
-        """Test moisture calibration."""
-        self.sensor.calibrate_moisture(30.0)
-        self.sensor.modbus.write_register.assert_called_once_with(
-            SoilRegister.MOISTURE_CAL,
-            300  # 30.0 * 10
+    def test_read_multiple_coalesces(self):
+        """Test that adjacent registers are read in one transaction."""
+        # Setup recorder: N/P/K occupy contiguous addresses
+        self.sensor.modbus.read_values = [100, 200, 300]
+
+        # Test
+        result = self.sensor.read_multiple(
+            ["nitrogen", "phosphorus", "potassium"]
         )
-        
-    def test_calibrate_ec(self):
-        """Test EC calibration."""
-        self.sensor.calibrate_ec(1000)
-        self.sensor.modbus.write_register.assert_called_once_with(
-            SoilRegister.EC_CAL,
-            1000
+        self.assertEqual(
+            result,
+            {"nitrogen": 100, "phosphorus": 200, "potassium": 300}
         )
-        
-    def test_calibrate_ph(self):
-        """Test pH calibration."""
-        self.sensor.calibrate_ph(7.0)
-        self.sensor.modbus.write_register.assert_called_once_with(
-            SoilRegister.PH_CAL,
-            70  # 7.0 * 10
+        self.assertEqual(
+            self.sensor.modbus.reads,
+            [(SoilRegister.NITROGEN, 3, 1)]
         )
+
+    # (method, argument, expected register, expected raw value)
+    CALIBRATIONS = [
+        ("calibrate_temperature", 25.5, SoilRegister.TEMP_CAL, 255),
+        ("calibrate_moisture", 30.0, SoilRegister.MOISTURE_CAL, 300),
+        ("calibrate_ec", 1000, SoilRegister.EC_CAL, 1000),
+        ("calibrate_ph", 7.0, SoilRegister.PH_CAL, 70)
+    ]
+
+    def test_calibrations(self):
+        """Test the calibration writes in one parametrized loop."""
+        for name, arg, reg, val in self.CALIBRATIONS:
+            with self.subTest(name=name):
+                self.sensor.modbus.writes.clear()
+                getattr(self.sensor, name)(arg)
+                self.assertEqual(self.sensor.modbus.writes, [(reg, val)])
         
     def test_settings(self):
         """Test device settings."""
         # Test setting address
         self.sensor.set_address(2)
-        self.sensor.modbus.write_register.assert_called_with(
-            SoilRegister.ADDRESS,
-            2
+        self.assertEqual(
+            self.sensor.modbus.writes[-1],
+            (SoilRegister.ADDRESS, 2)
         )
         
         # Test invalid address
@@ -132,9 +163,9 @@ class TestSoilSensor(unittest.TestCase):
             
         # Test setting baudrate
         self.sensor.set_baudrate(ModbusBaudRate.BAUD_9600)
-        self.sensor.modbus.write_register.assert_called_with(
-            SoilRegister.BAUDRATE,
-            2  # Code for 9600 baud
+        self.assertEqual(
+            self.sensor.modbus.writes[-1],
+            (SoilRegister.BAUDRATE, 2)  # Code for 9600 baud
         )
         
         # Test invalid baudrate
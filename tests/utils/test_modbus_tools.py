@@ -2,11 +2,27 @@
 Tests for Modbus tools functionality.
 """
 import unittest
-from unittest.mock import patch
 
 from src.core.constants import ModbusDataType, ModbusFunction, SoilRegister
 from src.utils.modbus_tools import ModbusCommand, ModbusTools, SoilSensorTools
 
+# Reference frames shared across tests, as bytes literals so they are
+# built once at import instead of via bytes([...]) in every test run.
+# Read 4 holding registers from 0x0000, slave 1 (with and without CRC)
+READ_ALL_CMD = b"\x01\x03\x00\x00\x00\x04\x44\x09"
+READ_ALL_CMD_NO_CRC = b"\x01\x03\x00\x00\x00\x04"
+READ_ALL_CMD_BAD_CRC = b"\x01\x03\x00\x00\x00\x04\x00\x00"
+# Write value 1234 to register 0x0000, slave 1
+WRITE_1234_CMD = b"\x01\x06\x00\x00\x04\xD2\x0B\x57"
+# Read response: registers 1234, 100
+READ_RESPONSE_2REG = b"\x01\x03\x04\x04\xD2\x00\x64\x44\x09"
+# Exception response: illegal data address (0x02)
+EXCEPTION_RESPONSE = b"\x01\x83\x02\x50\x61"
+# Soil "all" response: moisture=65.8%, temp=-10.1 C, EC=1000us/cm, pH=5.6
+SOIL_ALL_RESPONSE = b"\x01\x03\x08\x02\x92\xFF\x9B\x03\xE8\x00\x38\x44\x09"
+# Soil NPK response: N=100, P=200, K=300 mg/kg
+SOIL_NPK_RESPONSE = b"\x01\x03\x06\x00\x64\x00\xC8\x01\x2C\x44\x09"
+
 class TestModbusCommand(unittest.TestCase):
     """Test ModbusCommand class."""
     
@@ -18,8 +34,7 @@ class TestModbusCommand(unittest.TestCase):
             slave=1
         )
         # Expected: [slave, func, addr_hi, addr_lo, count_hi, count_lo, crc_lo, crc_hi]
-        expected = bytes([0x01, 0x03, 0x00, 0x00, 0x00, 0x04, 0x44, 0x09])
-        self.assertEqual(command, expected)
+        self.assertEqual(command, READ_ALL_CMD)
         
     def test_write_single_register(self):
         """Test generating write single register command."""
@@ -29,50 +44,36 @@ class TestModbusCommand(unittest.TestCase):
             slave=1
         )
         # Expected: [slave, func, addr_hi, addr_lo, value_hi, value_lo, crc_lo, crc_hi]
-        expected = bytes([0x01, 0x06, 0x00, 0x00, 0x04, 0xD2, 0x0B, 0x57])
-        self.assertEqual(command, expected)
+        self.assertEqual(command, WRITE_1234_CMD)
 
 class TestModbusTools(unittest.TestCase):
     """Test ModbusTools class."""
     
     def test_calculate_crc(self):
         """Test CRC calculation."""
-        data = bytes([0x01, 0x03, 0x00, 0x00, 0x00, 0x04])
-        crc = ModbusTools.calculate_crc(data)
-        self.assertEqual(crc, bytes([0x44, 0x09]))
+        crc = ModbusTools.calculate_crc(READ_ALL_CMD_NO_CRC)
+        self.assertEqual(crc, b"\x44\x09")
         
     def test_verify_crc(self):
         """Test CRC verification."""
-        data = bytes([0x01, 0x03, 0x00, 0x00, 0x00, 0x04, 0x44, 0x09])
-        self.assertTrue(ModbusTools.verify_crc(data))
-        
+        self.assertTrue(ModbusTools.verify_crc(READ_ALL_CMD))
+
         # Test invalid CRC
-        invalid_data = bytes([0x01, 0x03, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00])
-        self.assertFalse(ModbusTools.verify_crc(invalid_data))
-        
+        self.assertFalse(ModbusTools.verify_crc(READ_ALL_CMD_BAD_CRC))
+
         # Test too short data
-        short_data = bytes([0x01, 0x03])
-        self.assertFalse(ModbusTools.verify_crc(short_data))
+        self.assertFalse(ModbusTools.verify_crc(b"\x01\x03"))
         
     def test_parse_response(self):
         """Test response parsing."""
         # Test successful read response
-        response = bytes([
-            0x01,  # Slave address
-            0x03,  # Function code
-            0x04,  # Byte count
-            0x04, 0xD2,  # Register 1 (1234)
-            0x00, 0x64,  # Register 2 (100)
-            0x44, 0x09   # CRC
-        ])
-        result = ModbusTools.parse_response(response)
+        result = ModbusTools.parse_response(READ_RESPONSE_2REG)
         self.assertEqual(result["slave_address"], 0x01)
         self.assertEqual(result["function_code"], 0x03)
         self.assertEqual(result["registers"], [1234, 100])
         
         # Test exception response
-        exception = bytes([0x01, 0x83, 0x02, 0x50, 0x61])  # Updated CRC
-        result = ModbusTools.parse_response(exception)
+        result = ModbusTools.parse_response(EXCEPTION_RESPONSE)
         self.assertTrue(result["error"])
         self.assertEqual(result["exception_code"], 0x02)
         
@@ -108,37 +109,17 @@ class TestSoilSensorTools(unittest.TestCase):
     
     def test_parse_raw_data_all(self):
         """Test parsing all sensor parameters."""
-        # Example data: moisture=65.8%, temp=-10.1°C, EC=1000us/cm, pH=5.6
-        raw_data = bytes([
-            0x01,  # Slave address
-            0x03,  # Function code
-            0x08,  # Byte count
-            0x02, 0x92,  # Moisture (658)
-            0xFF, 0x9B,  # Temperature (-101)
-            0x03, 0xE8,  # EC (1000)
-            0x00, 0x38,  # pH (56)
-            0x44, 0x09   # CRC
-        ])
-        result = SoilSensorTools.parse_raw_data(raw_data, "all")
+        result = SoilSensorTools.parse_raw_data(SOIL_ALL_RESPONSE, "all")
         
-        self.assertAlmostEqual(result["moisture"], 65.8, places=1)
-        self.assertAlmostEqual(result["temperature"], -10.1, places=1)
+        # The /10 scales are exact, so compare in the integer domain
+        self.assertEqual(round(result["moisture"] * 10), 658)
+        self.assertEqual(round(result["temperature"] * 10), -101)
         self.assertEqual(result["ec"], 1000)
-        self.assertAlmostEqual(result["ph"], 5.6, places=1)
+        self.assertEqual(round(result["ph"] * 10), 56)
         
     def test_parse_raw_data_npk(self):
         """Test parsing NPK values."""
-        # Example data: N=100, P=200, K=300 mg/kg
-        raw_data = bytes([
-            0x01,  # Slave address
-            0x03,  # Function code
-            0x06,  # Byte count
-            0x00, 0x64,  # N (100)
-            0x00, 0xC8,  # P (200)
-            0x01, 0x2C,  # K (300)
-            0x44, 0x09   # CRC
-        ])
-        result = SoilSensorTools.parse_raw_data(raw_data, "npk")
+        result = SoilSensorTools.parse_raw_data(SOIL_NPK_RESPONSE, "npk")
         
         self.assertEqual(result["nitrogen"], 100)
         self.assertEqual(result["phosphorus"], 200)
@@ -167,39 +148,21 @@ class TestSoilSensorTools(unittest.TestCase):
         
     def test_analyze_response(self):
         """Test response analysis."""
-        # Skip CRC validation for testing
-        ModbusTools.verify_crc = lambda x: True
-        
-        command = bytes([
-            0x01,  # Slave address
-            0x03,  # Function code
-            0x00, 0x00,  # Register address
-            0x00, 0x04,  # Count
-            0x44, 0x09   # CRC
-        ])
-        response = bytes([
-            0x01,  # Slave address
-            0x03,  # Function code
-            0x08,  # Byte count
-            0x02, 0x92,  # Moisture (658)
-            0xFF, 0x9B,  # Temperature (-101)
-            0x03, 0xE8,  # EC (1000)
-            0x00, 0x38,  # pH (56)
-            0x44, 0x09   # CRC
-        ])
-        
-        analysis = SoilSensorTools.analyze_response(command, response)
-        
-        self.assertTrue(analysis["command"]["crc_valid"])
-        self.assertTrue(analysis["response"]["crc_valid"])
+        # Skip CRC validation for testing via the verify flag; the
+        # skipped checks report None, not a fabricated True
+        analysis = SoilSensorTools.analyze_response(
+            READ_ALL_CMD, SOIL_ALL_RESPONSE, verify=False
+        )
+
+        self.assertIsNone(analysis["command"]["crc_valid"])
+        self.assertIsNone(analysis["response"]["crc_valid"])
         self.assertEqual(
             analysis["command"]["register_address"],
             f"0x{SoilRegister.MOISTURE:04X}"
         )
-        self.assertAlmostEqual(
-            analysis["parsed_values"]["moisture"],
-            65.8,
-            places=1
+        self.assertEqual(
+            round(analysis["parsed_values"]["moisture"] * 10),
+            658
         )
 
 if __name__ == '__main__':